@@ -9,11 +9,25 @@ st.set_page_config(
     page_icon="💬"
 )
 
+import importlib
+
+from modules import warmup
 from modules.sidebar import show_sidebar
-from tabs import (
-    tab1_welcome_hub, tab2_ethics_lab, tab3_ethics_academy,
-    tab4_self_reflection, tab5_ethics_dashboard,
-)
+
+# Muat model di background sekali per proses (ETHICATOR_PRELOAD=0 untuk mematikan)
+if warmup.PRELOAD:
+    warmup.start()
+
+# Modul tiap halaman di-import saat halaman itu pertama kali dibuka, sehingga
+# dependency berat (sklearn, Sastrawi, plotly, wordcloud) tidak dimuat untuk
+# pengguna yang hanya membuka Welcome Hub.
+PAGES = {
+    "Welcome Hub": "tabs.tab1_welcome_hub",
+    "Ethics Lab": "tabs.tab2_ethics_lab",
+    "Ethics Academy": "tabs.tab3_ethics_academy",
+    "Self Reflection": "tabs.tab4_self_reflection",
+    "Ethics Dashboard": "tabs.tab5_ethics_dashboard",
+}
 
 # -------------------------
 # Styling Umum (CSS)
@@ -150,29 +164,14 @@ show_sidebar()
 # -------------------------
 tab = st.sidebar.radio(
     "Choose Page:",
-    [
-        "Welcome Hub",
-        "Ethics Lab",
-        "Ethics Academy",
-        "Self Reflection",
-        "Ethics Dashboard"
-    ],
+    list(PAGES),
     key="tab_selection"
 )
 
 # -------------------------
 # Routing Tab
 # -------------------------
-if tab == "Welcome Hub":
-    tab1_welcome_hub.run()
-elif tab == "Ethics Lab":
-    tab2_ethics_lab.run()
-elif tab == "Ethics Academy":
-    tab3_ethics_academy.run()
-elif tab == "Self Reflection":
-    tab4_self_reflection.run()
-elif tab == "Ethics Dashboard":
-    tab5_ethics_dashboard.run()
+importlib.import_module(PAGES[tab]).run()
 
 # -------------------------
 # Footer
@@ -0,0 +1,113 @@
+# ============================================================
+# 🪜 benchmarks/cascade_report.py — Dampak cascade HS/Abusive → sub-label
+# ============================================================
+"""Seberapa sering gate cascade mengubah status akhir pada data/data.csv.
+
+Untuk beberapa nilai gate, data.csv diskor dengan jalur penuh dan jalur
+cascade (HS & Abusive dulu, sub-label HS hanya jika probabilitas HS ≥ gate).
+Yang dilaporkan: porsi komentar yang sub-labelnya dilewati, porsi skor model
+yang dihemat, kecepatan skor model, dan perubahan status utama ala tab Self
+Reflection (ada merah → Hate Speech, ada kuning → Potensi Bias, selain itu
+Aman; label yang dilewati tidak dihitung). Juga dirinci sub-label yang
+sebenarnya merah/kuning tetapi dilewati gate.
+
+Kecepatan diukur atas teks yang sudah di-preprocess, untuk scorer gabungan
+(FusedLinearScorer) dan untuk jalur predict_proba per label.
+
+Jalankan dari root repo:
+    python -m benchmarks.cascade_report [--gates 0.1,0.2,0.3,0.42] [--limit N]
+"""
+import argparse
+import copy
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils import (CASCADE_LABELS, SKIPPED_STATUS, batch_statuses, configure_caches,
+                   load_predictor, predict_labels_batch)
+
+RED, YELLOW, SAFE = "🔴 Hate Speech", "🟡 Potensi Bias", "🟢 Etis / Aman"
+
+
+def overall_status(statuses):
+    """Status utama per komentar dari DataFrame status label (aturan tab Self Reflection)."""
+    return pd.Series(np.select(
+        [(statuses == RED).any(axis=1), (statuses == YELLOW).any(axis=1)], [RED, YELLOW], default=SAFE,
+    ), index=statuses.index)
+
+
+def _timed(clean, models, vectorizers, feature_index, cascade_gate=None):
+    start = time.perf_counter()
+    probs = predict_labels_batch(clean, models, vectorizers, lambda text: text, feature_index,
+                                 cascade_gate=cascade_gate)
+    return probs, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data", default="data/data.csv")
+    parser.add_argument("--gates", default="0.1,0.2,0.3,0.42", help="Nilai gate, dipisah koma.")
+    parser.add_argument("--limit", type=int, default=None, help="Ambil N komentar pertama saja.")
+    args = parser.parse_args(argv)
+
+    configure_caches(preprocess_size=0, result_size=0)  # ukur kerja sebenarnya
+    models, vectorizers, preprocessor, feature_index = load_predictor()
+    data = pd.read_csv(args.data, encoding="latin-1")
+    if args.limit:
+        data = data.head(args.limit)
+    texts = data["Tweet"].fillna("").astype(str).tolist()
+    clean = [preprocessor(t) for t in texts]  # preprocess sama di kedua jalur; yang dibandingkan skor model
+    per_label = copy.copy(feature_index)
+    if per_label is not None:
+        per_label.scorer = None  # paksa predict_proba per label
+    n, n_labels = len(texts), len(models)
+    sub_labels = [label for label in models if label not in CASCADE_LABELS]
+
+    full_probs, fused_seconds = _timed(clean, models, vectorizers, feature_index)
+    _, per_label_seconds = _timed(clean, models, vectorizers, per_label)
+    full = batch_statuses(full_probs)
+    full_overall = overall_status(full)
+    print(f"{n} komentar, {n_labels} label ({len(sub_labels)} sub-label di belakang gate)")
+    print(f"Jalur penuh: scorer gabungan {n / fused_seconds:,.0f} komentar/detik, per label "
+          f"{n / per_label_seconds:,.0f} komentar/detik; status utama "
+          + ", ".join(f"{s} {(full_overall == s).mean():.1%}" for s in (RED, YELLOW, SAFE)))
+
+    rows, missed = [], {}
+    for gate in (float(g) for g in args.gates.split(",")):
+        probs, fused = _timed(clean, models, vectorizers, feature_index, gate)
+        _, unfused = _timed(clean, models, vectorizers, per_label, gate)
+        statuses = batch_statuses(probs)
+        overall = overall_status(statuses)
+
+        gated = probs["HS"] >= gate
+        evaluated = statuses != SKIPPED_STATUS
+        skipped = ~evaluated[sub_labels]
+        rows.append({
+            "Gate": gate,
+            "Sub-label dilewati": (~gated).mean(),
+            "Skor model dihemat": skipped.to_numpy().sum() / (n * n_labels),
+            "Percepatan gabungan": fused_seconds / fused,
+            "Percepatan per label": per_label_seconds / unfused,
+            "Status utama berubah": (overall != full_overall).mean(),
+            "Hate Speech → lain": ((full_overall == RED) & (overall != RED)).mean(),
+            "Label dievaluasi berubah": int(((statuses != full) & evaluated).to_numpy().sum()),
+        })
+        missed[gate] = {
+            label: int((skipped[label] & full[label].isin([RED, YELLOW])).sum()) for label in sub_labels
+        }
+
+    report = pd.DataFrame(rows)
+    print("\n=== Cascade vs jalur penuh (porsi komentar) ===")
+    print(report.to_string(index=False, formatters={
+        "Gate": "{:.2f}".format, "Percepatan gabungan": "{:.1f}×".format,
+        "Percepatan per label": "{:.1f}×".format,
+        **{col: "{:.1%}".format for col in ("Sub-label dilewati", "Skor model dihemat",
+                                            "Status utama berubah", "Hate Speech → lain")},
+    }))
+    print("\n=== Sub-label merah/kuning di jalur penuh yang dilewati gate (jumlah komentar) ===")
+    print(pd.DataFrame(missed).rename(columns="gate {:.2f}".format).to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# ============================================================
+# 🧮 benchmarks/fused_parity.py — Paritas scorer gabungan vs predict_proba
+# ============================================================
+"""Bandingkan FusedLinearScorer dengan predict_proba per label pada data/data.csv.
+
+Jalankan dari root repo:
+    python -m benchmarks.fused_parity [--limit N] [--atol 1e-9]
+
+Keluar dengan kode 1 jika selisih probabilitas melebihi toleransi atau ada
+status etika yang berubah.
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils import label_status, load_models, load_resources
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data", default="data/data.csv")
+    parser.add_argument("--limit", type=int, default=None, help="Ambil N komentar pertama saja.")
+    parser.add_argument("--atol", type=float, default=1e-9)
+    args = parser.parse_args(argv)
+
+    preprocessor = load_resources()
+    models, vectorizers, feature_index = load_models()
+    if feature_index is None or feature_index.scorer is None:
+        print("Scorer gabungan tidak tersedia untuk models.pkl ini (model non-linear).")
+        return 1
+
+    tweets = pd.read_csv(args.data, encoding="latin-1")["Tweet"]
+    if args.limit:
+        tweets = tweets.head(args.limit)
+    clean = [preprocessor(t) for t in tweets]
+
+    start = time.perf_counter()
+    expected = np.column_stack([
+        model.predict_proba(vectorizers[label].transform(clean))[:, 1]
+        for label, model in models.items()
+    ])
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fused = feature_index.scorer.predict_proba(feature_index.count(clean))
+    fused_time = time.perf_counter() - start
+
+    diff = np.abs(expected - fused)
+    status_changed = sum(
+        label_status(a) != label_status(b)
+        for a, b in zip(expected.ravel(), fused.ravel())
+    )
+    print(f"Komentar           : {len(clean)}")
+    print(f"Selisih maks       : {diff.max():.3e}")
+    print(f"Status berubah     : {status_changed}")
+    print(f"predict_proba loop : {loop_time:.3f} s")
+    print(f"Scorer gabungan    : {fused_time:.3f} s ({loop_time / fused_time:.1f}x)")
+    return 0 if diff.max() <= args.atol and status_changed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+# ============================================================
+# 🔤 benchmarks/fuzzy_alay_report.py — Dampak normalisasi alay perkiraan
+# ============================================================
+"""Bandingkan Preprocessor biasa vs dengan AlayIndex pada data/data.csv.
+
+Memeriksa bahwa komentar tanpa token yang dinormalisasi perkiraan (hanya
+cocok persis / tidak cocok sama sekali) menghasilkan teks bersih yang identik,
+lalu melaporkan cakupan, contoh padanan, kecepatan, dan perubahan status model.
+
+Jalankan dari root repo:
+    python -m benchmarks.fuzzy_alay_report [--limit N] [--examples 20]
+
+Keluar dengan kode 1 jika ada komentar tanpa padanan perkiraan yang hasilnya berubah.
+"""
+import argparse
+import re
+import sys
+import time
+from collections import Counter
+
+import pandas as pd
+
+from modules.preprocessor import Preprocessor
+from utils import batch_statuses, build_alay_index, load_models, load_resources, predict_labels_batch
+
+_SYMBOLS = re.compile('[^0-9a-zA-Z]+')
+_TAGS = re.compile(r'rt|user|www|https?://\S+')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data", default="data/data.csv")
+    parser.add_argument("--limit", type=int, default=None, help="Ambil N komentar pertama saja.")
+    parser.add_argument("--examples", type=int, default=20, help="Jumlah contoh padanan yang ditampilkan.")
+    args = parser.parse_args(argv)
+
+    exact = load_resources()
+    if exact.alay_index is not None:
+        print("Matikan ETHICATOR_FUZZY_ALAY untuk baseline yang benar.")
+        return 1
+    start = time.perf_counter()
+    index = build_alay_index(exact.alay_dict_map, exact.stopwords, exact.stemmer)
+    print(f"AlayIndex dibangun dalam {time.perf_counter() - start:.2f} s "
+          f"({len(index.collapsed)} bentuk ringkas)")
+    fuzzy = Preprocessor(exact.alay_dict_map, exact.stopwords, exact.stemmer, alay_index=index)
+
+    tweets = pd.read_csv(args.data, encoding="latin-1")["Tweet"].fillna("").astype(str)
+    if args.limit:
+        tweets = tweets.head(args.limit)
+
+    timings = {}
+    for name, preprocessor in (("persis", exact), ("perkiraan", fuzzy)):
+        preprocessor.cache = None
+        start = time.perf_counter()
+        timings[name] = [preprocessor(t) for t in tweets], time.perf_counter() - start
+    clean_exact, clean_fuzzy = timings["persis"][0], timings["perkiraan"][0]
+
+    hits, touched, broken = Counter(), [], 0
+    for i, text in enumerate(tweets):
+        tokens = _TAGS.sub(' ', _SYMBOLS.sub(' ', text.lower())).split()
+        found = [(t, index(t)) for t in tokens if t not in exact.alay_dict_map]
+        found = [(t, v) for t, v in found if v is not None]
+        hits.update(found)
+        if found:
+            touched.append(i)
+        elif clean_exact[i] != clean_fuzzy[i]:
+            broken += 1
+
+    n = len(tweets)
+    for name, (_, seconds) in timings.items():
+        print(f"Preprocess {name:<10}: {seconds * 1000 / n:.3f} ms/komentar")
+    print(f"Komentar dengan padanan perkiraan: {len(touched)}/{n} ({len(touched) / n:.1%}), "
+          f"{sum(hits.values())} token, {len(hits)} token unik")
+    print(f"Komentar tanpa padanan perkiraan yang berubah: {broken}")
+    for (token, value), count in hits.most_common(args.examples):
+        print(f"  {token} → {value} ({count}x)")
+
+    if touched:
+        models, vectorizers, feature_index = load_models()
+        identity = lambda text: text  # noqa: E731 — teks sudah bersih
+        before = batch_statuses(predict_labels_batch(
+            [clean_exact[i] for i in touched], models, vectorizers, identity, feature_index))
+        after = batch_statuses(predict_labels_batch(
+            [clean_fuzzy[i] for i in touched], models, vectorizers, identity, feature_index))
+        changed = (before != after).any(axis=1)
+        print(f"Status label berubah pada {int(changed.sum())}/{len(touched)} komentar yang tersentuh:")
+        for label in before.columns:
+            print(f"  {label:<16}{int((before[label] != after[label]).sum()):>6}")
+
+    return 1 if broken else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
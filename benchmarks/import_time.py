@@ -0,0 +1,82 @@
+# ============================================================
+# 🚦 benchmarks/import_time.py — Waktu import (cold start) per halaman
+# ============================================================
+"""Laporan ala ``python -X importtime`` untuk modul tiap halaman app.
+
+Setiap modul di-import di interpreter baru (``-X importtime``) beberapa kali;
+yang dilaporkan median waktu import kumulatif, paket dependency berat yang
+ikut termuat, dan paket dengan waktu import sendiri (self) terbesar.
+
+Jalankan dari root repo:
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --modules utils,tabs.tab2_ethics_lab --top 15 --json hasil.json
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+MODULES = (
+    "streamlit",
+    "utils",
+    "tabs.tab1_welcome_hub",
+    "tabs.tab2_ethics_lab",
+    "tabs.tab3_ethics_academy",
+    "tabs.tab4_self_reflection",
+    "tabs.tab5_ethics_dashboard",
+)
+# Dependency yang seharusnya hanya dimuat saat dibutuhkan
+HEAVY = ("sklearn", "scipy", "Sastrawi", "matplotlib", "wordcloud", "plotly")
+
+
+def import_profile(module):
+    """Satu import di interpreter baru → (total µs, {paket: self µs})."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          capture_output=True, text=True, check=True)
+    self_us, total = defaultdict(int), 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        package = name.strip().split(".")[0]
+        self_us[package] += int(own)
+        if name.strip() == module:
+            total = int(cumulative)
+    return total, dict(self_us)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modules", default=",".join(MODULES), help="Modul yang diukur, dipisah koma.")
+    parser.add_argument("--repeat", type=int, default=3, help="Pengulangan per modul (diambil median).")
+    parser.add_argument("--top", type=int, default=8, help="Jumlah paket terberat yang ditampilkan.")
+    parser.add_argument("--json", default=None, help="Simpan hasil ke file JSON.")
+    args = parser.parse_args(argv)
+
+    results = []
+    print(f"{'Modul':<30}{'Import (ms)':>13}  Dependency berat")
+    for module in args.modules.split(","):
+        runs = [import_profile(module) for _ in range(args.repeat)]
+        total_ms = statistics.median(total for total, _ in runs) / 1000
+        packages = runs[-1][1]
+        heavy = [p for p in HEAVY if p in packages]
+        results.append({"module": module, "import_ms": total_ms, "heavy": heavy, "packages_ms": {
+            p: us / 1000 for p, us in sorted(packages.items(), key=lambda item: -item[1])[:args.top]
+        }})
+        print(f"{module:<30}{total_ms:>13.0f}  {', '.join(heavy) or '-'}")
+
+    print("\nPaket terberat (self ms, run terakhir) per modul:")
+    for result in results:
+        top = ", ".join(f"{p} {ms:.0f}" for p, ms in result["packages_ms"].items())
+        print(f"  {result['module']}: {top}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version.split()[0], "results": results}, f, indent=1)
+        print(f"Hasil disimpan ke {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# ============================================================
+# ⏱️ benchmarks/preprocessor_bench.py — Latensi preprocess per komentar
+# ============================================================
+"""Bandingkan utils.preprocess (list stopword) dengan Preprocessor terkompilasi.
+
+Keduanya memakai StemCache hangat yang sama, tanpa cache kalimat, dan
+hasilnya diverifikasi identik untuk seluruh korpus.
+
+Jalankan dari root repo:
+    python -m benchmarks.preprocessor_bench [--repeat 3]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from modules.preprocessor import Preprocessor
+from utils import load_resources, preprocess
+
+
+def _latencies(fn, tweets, repeat):
+    best = np.full(len(tweets), np.inf)
+    for _ in range(repeat):
+        for i, text in enumerate(tweets):
+            start = time.perf_counter()
+            fn(text)
+            best[i] = min(best[i], time.perf_counter() - start)
+    return best * 1e6  # mikrodetik
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data", default="data/data.csv")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    resources = load_resources()
+    alay_dict_map, stemmer = resources.alay_dict_map, resources.stemmer
+    stopword_list = pd.read_csv("data/stopwordbahasa.csv", header=None)[0].tolist()
+    compiled = Preprocessor(alay_dict_map, stopword_list, stemmer)
+    tweets = pd.read_csv(args.data, encoding="latin-1")["Tweet"].tolist()
+
+    def before(text):
+        return preprocess(text, alay_dict_map, stopword_list, stemmer)
+
+    # Hangatkan StemCache untuk kata yang belum ada, sekaligus cek paritas
+    mismatch = sum(before(t) != compiled(t) for t in tweets)
+    alay_mismatch = sum(before(v) != compiled(v) for v in map(str, alay_dict_map.values()))
+
+    print(f"Komentar: {len(tweets)}, hasil berbeda: {mismatch} (korpus) / {alay_mismatch} (kamus alay)")
+    print(f"{'Varian':<26}{'mean µs':>10}{'p50 µs':>10}{'p95 µs':>10}")
+    results = {}
+    for name, fn in [("preprocess (list)", before), ("Preprocessor", compiled)]:
+        lat = _latencies(fn, tweets, args.repeat)
+        results[name] = lat.mean()
+        print(f"{name:<26}{lat.mean():>10.1f}{np.percentile(lat, 50):>10.1f}{np.percentile(lat, 95):>10.1f}")
+    print(f"Speedup: {results['preprocess (list)'] / results['Preprocessor']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# ============================================================
+# 🚨 benchmarks/prescreen_report.py — Trade-off pre-screen leksikon vs model penuh
+# ============================================================
+"""Precision/recall pre-screen data/abusive.csv terhadap model penuh pada data/data.csv.
+
+Komentar yang ditandai pre-screen dianggap "positif". Target pembanding:
+status model penuh (label Abusive / HS merah, status utama Hate Speech, atau
+status utama bukan Etis / Aman) dan label asli di data.csv. Juga dilaporkan
+porsi komentar yang dilewati --fast dan kecepatan end-to-end (terbaik dari
+``--repeat`` kali, karena satu kali ukur terlalu bising).
+
+Jalankan dari root repo:
+    python -m benchmarks.prescreen_report [--limit N] [--repeat 3]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from modules.prescreen import ABUSIVE_PATH, Prescreen
+from utils import batch_statuses, configure_caches, load_predictor, predict_labels_batch
+
+RED, SAFE = "🔴 Hate Speech", "🟢 Etis / Aman"
+
+
+def _best_seconds(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _row(name, flagged, target):
+    tp = int((flagged & target).sum())
+    return {
+        "Target": name,
+        "Positif": int(target.sum()),
+        "Precision": tp / flagged.sum() if flagged.sum() else float("nan"),
+        "Recall": tp / target.sum() if target.sum() else float("nan"),
+        "Positif terlewat": int((~flagged & target).sum()),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data", default="data/data.csv")
+    parser.add_argument("--lexicon", default=ABUSIVE_PATH)
+    parser.add_argument("--limit", type=int, default=None, help="Ambil N komentar pertama saja.")
+    parser.add_argument("--repeat", type=int, default=3, help="Pengulangan pengukuran kecepatan (diambil terbaik).")
+    args = parser.parse_args(argv)
+
+    configure_caches(preprocess_size=0, result_size=0)  # ukur kerja sebenarnya
+    models, vectorizers, preprocessor, feature_index = load_predictor()
+    data = pd.read_csv(args.data, encoding="latin-1")
+    if args.limit:
+        data = data.head(args.limit)
+    texts = data["Tweet"].fillna("").astype(str).tolist()
+    n = len(texts)
+
+    full = batch_statuses(predict_labels_batch(texts, models, vectorizers, preprocessor, feature_index))
+    full_seconds = _best_seconds(
+        lambda: predict_labels_batch(texts, models, vectorizers, preprocessor, feature_index), args.repeat)
+
+    targets = {
+        "Model: Abusive merah": (full["Abusive"] == RED).to_numpy(),
+        "Model: HS merah": (full["HS"] == RED).to_numpy(),
+        "Model: status utama Hate Speech": (full == RED).any(axis=1).to_numpy(),
+        "Model: status utama bukan aman": (full != SAFE).any(axis=1).to_numpy(),
+    }
+    for label in ("Abusive", "HS"):
+        if label in data.columns:
+            targets[f"Label asli: {label}"] = (data[label] == 1).to_numpy()
+
+    for shouting in (False, True):
+        prescreen = Prescreen.from_csv(args.lexicon, preprocessor.alay_dict_map, shouting=shouting)
+        start = time.perf_counter()
+        flagged = np.array([prescreen(t) for t in texts])
+        screen_us = (time.perf_counter() - start) / n * 1e6
+
+        fast_seconds = _best_seconds(
+            lambda: predict_labels_batch(texts, models, vectorizers, preprocessor, feature_index, prescreen),
+            args.repeat)
+
+        signals = "leksikon" + (" + huruf kapital semua" if shouting else "")
+        print(f"\n=== Pre-screen: {signals} ({len(prescreen.lexicon)} token, "
+              f"{len({entry for forms in prescreen.phrases.values() for _, entry in forms})} frasa) ===")
+        print(f"Ditandai {flagged.sum()}/{n} ({flagged.mean():.1%}); dilewati --fast {1 - flagged.mean():.1%}")
+        print(f"Pre-screen {screen_us:.1f} µs/komentar; batch penuh {n / full_seconds:,.0f} komentar/detik, "
+              f"--fast {n / fast_seconds:,.0f} komentar/detik ({full_seconds / fast_seconds:.1f}×)")
+        report = pd.DataFrame([_row(name, flagged, target) for name, target in targets.items()])
+        print(report.to_string(index=False, float_format=lambda x: f"{x:.3f}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# ============================================================
+# ⏱️ benchmarks/stem_cache_bench.py — Kecepatan preprocess dengan StemCache
+# ============================================================
+"""Ukur preprocess pada seluruh data/data.csv dengan tiga varian stemmer.
+
+1. Sastrawi bawaan (CachedStemmer, kamus berupa list) — sangat lambat saat
+   dingin, jadi hanya diukur pada ``--baseline-limit`` tweet lalu diekstrapolasi
+   (perkiraan atas: cache bawaan Sastrawi makin sering kena di korpus penuh).
+2. StemCache kosong (kamus sudah di-set, cache terisi selama berjalan).
+3. StemCache hangat dari data/stem_cache.csv.
+
+Jalankan dari root repo:
+    python -m benchmarks.stem_cache_bench [--baseline-limit 200]
+"""
+import argparse
+import time
+
+import pandas as pd
+from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
+
+from modules.stem_cache import STEM_CACHE_PATH, StemCache
+from utils import load_resources, preprocess
+
+
+def _run(tweets, alay_dict_map, stopword_list, stemmer):
+    start = time.perf_counter()
+    clean = [preprocess(t, alay_dict_map, stopword_list, stemmer) for t in tweets]
+    return clean, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data", default="data/data.csv")
+    parser.add_argument("--baseline-limit", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    resources = load_resources()
+    alay_dict_map, stopword_list = resources.alay_dict_map, resources.stopwords
+    tweets = pd.read_csv(args.data, encoding="latin-1")["Tweet"].tolist()
+    n = len(tweets)
+
+    sample = tweets[:args.baseline_limit]
+    base_clean, base_time = _run(sample, alay_dict_map, stopword_list, StemmerFactory().create_stemmer())
+    base_full = base_time / len(sample) * n
+
+    cold_clean, cold_time = _run(tweets, alay_dict_map, stopword_list, StemCache(StemmerFactory().create_stemmer()))
+    warm = StemCache.load(StemmerFactory().create_stemmer(), STEM_CACHE_PATH)
+    warm_clean, warm_time = _run(tweets, alay_dict_map, stopword_list, warm)
+
+    assert base_clean == cold_clean[:len(sample)] == warm_clean[:len(sample)]
+    assert cold_clean == warm_clean
+
+    print(f"Tweet: {n}")
+    print(f"{'Varian':<32}{'total (s)':>12}{'ms/tweet':>12}{'speedup':>10}")
+    for name, total in [
+        (f"Sastrawi bawaan (est. {len(sample)})", base_full),
+        ("StemCache dingin", cold_time),
+        ("StemCache hangat (disk)", warm_time),
+    ]:
+        print(f"{name:<32}{total:>12.2f}{total / n * 1000:>12.3f}{base_full / total:>9.0f}x")
+    print(f"Hit rate StemCache hangat: {warm.hits / max(warm.hits + warm.misses, 1):.2%}")
+
+
+if __name__ == "__main__":
+    main()
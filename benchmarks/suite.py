@@ -0,0 +1,242 @@
+# ============================================================
+# 📏 benchmarks/suite.py — Suite benchmark inferensi + deteksi regresi
+# ============================================================
+"""Ukur preprocess, predict_labels, jalur load model, dan data dashboard.
+
+Korpus tetap diambil dari data/data.csv (sampel acak dengan seed) pada beberapa
+ukuran. Setiap (kasus, ukuran) dijalankan di proses baru agar peak RSS-nya
+terpisah. Hasil (p50/p95/p99, throughput, peak RSS) disimpan sebagai JSON dan
+bisa dibandingkan dengan file hasil sebelumnya.
+
+Jalankan dari root repo:
+    python -m benchmarks.suite --out benchmarks/results/baru.json
+    python -m benchmarks.suite --baseline benchmarks/results/lama.json --threshold 0.15
+
+Keluar dengan kode 1 jika ada regresi melebihi ``--threshold`` terhadap baseline.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import get_context
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+CASES = ("preprocess", "predict_labels", "predict_batch", "load", "dashboard")
+# Metrik yang dibandingkan: True = makin besar makin buruk
+COMPARED = {"p50_ms": True, "p95_ms": True, "throughput_per_s": False, "peak_rss_mb": True}
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # Linux: KB
+
+
+def _corpus(data, size, seed):
+    import pandas as pd
+
+    tweets = pd.read_csv(data, encoding="latin-1")["Tweet"].fillna("").astype(str)
+    return tweets.sample(n=min(size, len(tweets)), random_state=seed).tolist()
+
+
+def _timed(fn, items, passes=1):
+    """Latensi (detik) setiap panggilan ``fn(item)``."""
+    samples = []
+    for _ in range(passes):
+        for item in items:
+            start = time.perf_counter()
+            fn(item)
+            samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _populate_dashboard_db(path, texts, predictor):
+    """Isi database sementara dengan satu aktivitas per komentar (status dari model)."""
+    from modules.log_store import LOG_LABELS
+    from modules.rollups import word_tokens
+    from modules.storage import ActivityStore
+    from utils import batch_to_results, predict_labels_batch
+
+    models, vectorizers, preprocessor, feature_index = predictor
+    store = ActivityStore(path)
+    results = batch_to_results(predict_labels_batch(texts, models, vectorizers, preprocessor, feature_index))
+    for i, (text, labels) in enumerate(zip(texts, results)):
+        flags = [info["Status"] for info in labels.values()]
+        status = next((s for s in ("🔴 Hate Speech", "🟡 Potensi Bias") if s in flags), "🟢 Etis / Aman")
+        row = {
+            "Tanggal": f"2025-10-{1 + i % 28:02d} {i % 24:02d}:00:00",
+            "Komentar": text, "Emosi": "😐 Netral", "Status Etika": status,
+            "Poin": {"🔴 Hate Speech": 10, "🟡 Potensi Bias": 25}.get(status, 35),
+        }
+        for label in LOG_LABELS:
+            row[f"{label}_Prob"] = labels[label]["Probability"]
+            row[f"{label}_Status"] = labels[label]["Status"]
+        store.add_activity(row, username="bench", words=word_tokens(preprocessor(text)))
+    return store
+
+
+def run_case(case, size, data, seed, min_samples):
+    """Jalankan satu kasus di proses ini → dict hasil (dipanggil di proses baru)."""
+    import streamlit.logger
+
+    streamlit.logger.set_log_level("error")  # mode bare, tanpa runtime Streamlit
+    from utils import configure_caches, load_models, load_predictor, load_resources
+    from utils import predict_labels, predict_labels_batch
+
+    # Ukur kerja sebenarnya, bukan cache LRU komentar berulang
+    configure_caches(preprocess_size=0, result_size=0)
+    texts = _corpus(data, size, seed) if size else []
+    passes = max(1, math.ceil(min_samples / max(size, 1)))
+    items = len(texts)
+
+    if case == "load":
+        samples = []
+        for _ in range(max(3, min_samples // 100)):
+            load_models.clear()
+            load_resources.clear()
+            start = time.perf_counter()
+            load_predictor()
+            samples.append(time.perf_counter() - start)
+        items = 1
+    else:
+        predictor = load_predictor()
+        models, vectorizers, preprocessor, feature_index = predictor
+        if case == "preprocess":
+            samples = _timed(preprocessor, texts, passes)
+            items = 1
+        elif case == "predict_labels":
+            samples = _timed(
+                lambda t: predict_labels(t, models, vectorizers, preprocessor, feature_index), texts, passes
+            )
+            items = 1
+        elif case == "predict_batch":
+            samples = _timed(
+                lambda batch: predict_labels_batch(batch, models, vectorizers, preprocessor, feature_index),
+                [texts], max(3, min(passes, 50)),
+            )
+        elif case == "dashboard":
+            from datetime import date
+
+            from modules.dashboard_data import load_dashboard_data
+
+            with tempfile.TemporaryDirectory() as tmp:
+                store = _populate_dashboard_db(os.path.join(tmp, "bench.db"), texts, predictor)
+                samples = _timed(lambda _: load_dashboard_data(store, "bench", date(2025, 10, 28)),
+                                 range(max(20, min(passes, 200))))
+            items = 1
+        else:
+            raise ValueError(f"Kasus tidak dikenal: {case}")
+
+    lat = np.array(samples) * 1000
+    return {
+        "case": case,
+        "size": size or None,
+        "samples": len(samples),
+        "mean_ms": float(lat.mean()),
+        "p50_ms": float(np.percentile(lat, 50)),
+        "p95_ms": float(np.percentile(lat, 95)),
+        "p99_ms": float(np.percentile(lat, 99)),
+        "throughput_per_s": float(items * len(samples) / (lat.sum() / 1000)),
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def compare(current, baseline, threshold):
+    """Daftar regresi: (case, size, metrik, lama, baru, perubahan relatif)."""
+    previous = {(r["case"], r["size"]): r for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        old = previous.get((result["case"], result["size"]))
+        if old is None:
+            continue
+        for metric, higher_is_worse in COMPARED.items():
+            before, after = old.get(metric), result.get(metric)
+            if not before or after is None:
+                continue
+            change = (after - before) / before
+            if (change if higher_is_worse else -change) > threshold:
+                regressions.append((result["case"], result["size"], metric, before, after, change))
+    return regressions
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data", default="data/data.csv")
+    parser.add_argument("--sizes", default="1,100,10000", help="Ukuran korpus, dipisah koma.")
+    parser.add_argument("--cases", default=",".join(CASES), help=f"Kasus, dipisah koma ({', '.join(CASES)}).")
+    parser.add_argument("--seed", type=int, default=0, help="Seed sampel korpus.")
+    parser.add_argument("--min-samples", type=int, default=300, help="Minimum sampel latensi per kasus.")
+    parser.add_argument("--out", default="benchmarks/results/latest.json")
+    parser.add_argument("--baseline", default=None, help="File hasil sebelumnya untuk deteksi regresi.")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Batas regresi relatif (0.10 = 10%%).")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",")]
+    cases = [c.strip() for c in args.cases.split(",")]
+    jobs = [(case, None if case == "load" else size) for case in cases
+            for size in ([0] if case == "load" else sizes)]
+
+    print(f"{'Kasus':<16}{'N':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'/detik':>11}{'RSS MB':>9}")
+    results = []
+    for case, size in jobs:
+        # Proses baru per kasus: peak RSS terpisah dan cache Streamlit bersih
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+            result = pool.submit(run_case, case, size or 0, args.data, args.seed, args.min_samples).result()
+        results.append(result)
+        rss = f"{result['peak_rss_mb']:.0f}" if result["peak_rss_mb"] is not None else "-"
+        print(f"{case:<16}{size or '-':>7}{result['p50_ms']:>10.3f}{result['p95_ms']:>10.3f}"
+              f"{result['p99_ms']:>10.3f}{result['throughput_per_s']:>11,.0f}{rss:>9}")
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "sizes": sizes,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=1)
+    print(f"Hasil disimpan ke {args.out}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"⚠️ {len(regressions)} regresi > {args.threshold:.0%} terhadap {args.baseline}:")
+            for case, size, metric, before, after, change in regressions:
+                print(f"  {case} N={size or '-'} {metric}: {before:.3f} → {after:.3f} ({change:+.0%})")
+            return 1
+        print(f"✅ Tidak ada regresi > {args.threshold:.0%} terhadap {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
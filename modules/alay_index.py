@@ -0,0 +1,129 @@
+# ============================================================
+# 🔤 modules/alay_index.py — Normalisasi alay perkiraan (huruf berulang & kata gabung)
+# ============================================================
+"""Indeks untuk token yang tidak persis ada di kamus alay.
+
+Kamus alay hanya cocok untuk token utuh yang persis sama. Indeks ini
+menangani dua variasi yang sering lolos:
+
+- huruf berulang (``bangeeet``, ``anjiiir``): setiap deret huruf sama
+  diringkas menjadi satu huruf lalu dicocokkan dengan bentuk ringkas kunci
+  kamus dan kata baku;
+- kata gabung (``sayangkamu``): token ringkas dipecah habis menjadi potongan
+  yang dikenal lewat trie (DP segmentasi, jumlah potongan paling sedikit).
+
+Keduanya linear terhadap panjang token (langkah trie dibatasi kedalaman trie).
+Token yang persis ada di kamus alay, sudah berupa kata baku (nilai kamus alay,
+stopword, atau ``protected`` — mis. kata dasar Sastrawi dan vocabulary model)
+tidak pernah disentuh, sehingga hasil untuk token yang cocok persis tetap sama.
+"""
+import re
+from functools import lru_cache
+
+_REPEATS = re.compile(r'([a-z])\1+')
+_ELONGATED = re.compile(r'([a-z])\1\1')  # minimal 3 huruf sama berturut-turut
+_END = ''  # penanda akhir kata di node trie
+
+
+def collapse(token):
+    """Ringkas setiap deret huruf sama menjadi satu huruf (``bangeeet`` → ``banget``); angka dibiarkan."""
+    return _REPEATS.sub(r'\1', token)
+
+
+class AlayIndex:
+    """``index(token)`` → teks pengganti, atau None jika tidak ada padanan.
+
+    Aturan konservatif agar kata yang tidak dikenal (nama, istilah, kata
+    berimbuhan) tidak terpecah sembarangan:
+
+    - huruf berulang hanya diringkas jika ada ≥3 huruf sama berturut-turut;
+    - kata di ``protected`` (kata dasar Sastrawi, vocabulary model) dianggap
+      kata baku: tidak pernah dipecah (``matahari`` bukan ``mata hari``);
+    - hanya token alfabet sepanjang ``min_split`` ke atas yang dipecah, dan
+      tidak jika ``stem(token)`` mengubahnya (kata berimbuhan seperti
+      ``pembaca`` sudah ditangani stemmer);
+    - potongan harus berupa stopword atau kata baku dari nilai kamus (≥4
+      huruf), atau kunci alay (≥5 huruf); potongan pendek seperti ``ber``
+      atau ``ih`` terlalu ambigu.
+    """
+
+    def __init__(self, alay_dict_map, stopwords=(), stem=None, min_split=6, cache_size=65536, protected=()):
+        self.alay_dict_map = alay_dict_map
+        self.stem = stem
+        self.min_split = min_split
+        stopwords = {str(w) for w in stopwords}
+        words = {str(w) for value in alay_dict_map.values() for w in str(value).split()}
+        self.known = frozenset(words | stopwords | {str(w) for w in protected})
+
+        # Bentuk ringkas → pengganti. Urutan prioritas bila bentuk ringkas
+        # bertabrakan: kunci alay yang sudah ringkas, kata baku yang sudah
+        # ringkas, lalu sisanya (urutan pertama muncul).
+        entries = [(str(k), str(v)) for k, v in alay_dict_map.items()]
+        entries += [(w, w) for w in sorted(self.known)]
+        self.collapsed = {}
+        for exact_first in (True, False):
+            for key, value in entries:
+                short = collapse(key)
+                if (short == key) == exact_first:
+                    self.collapsed.setdefault(short, value)
+
+        # Trie potongan kata gabung (atas bentuk ringkas), prioritas sama: stopword, kata baku, kunci alay
+        self.trie = {}
+        pieces = [(w, w, 4) for w in sorted(stopwords)] + [(w, w, 4) for w in sorted(words)]
+        pieces += [(str(k), str(v), 5) for k, v in alay_dict_map.items()]
+        for key, value, min_len in pieces:
+            short = collapse(key)
+            if len(short) < min_len or not key.isalpha():
+                continue
+            node = self.trie
+            for ch in short:
+                node = node.setdefault(ch, {})
+            node.setdefault(_END, value)
+
+        self._lookup = lru_cache(maxsize=cache_size)(self._find)
+
+    def __call__(self, token):
+        if token in self.alay_dict_map or token in self.known:
+            return None
+        return self._lookup(token)
+
+    def _find(self, token):
+        if _ELONGATED.search(token):
+            short = collapse(token)
+            if short in self.collapsed:
+                return self.collapsed[short]
+        if len(token) >= self.min_split and token.isalpha() and (self.stem is None or self.stem(token) == token):
+            pieces = self.segment(token)
+            if pieces is not None and len(pieces) > 1:
+                return ' '.join(pieces)
+        return None
+
+    def segment(self, text):
+        """Pecah ``text`` habis menjadi potongan di trie (paling sedikit) → list pengganti, atau None.
+
+        Trie berisi bentuk ringkas, jadi huruf yang sama dengan huruf sebelumnya
+        boleh "diserap" potongan yang sedang berjalan (``sayaaang`` = ``sayang``).
+        """
+        n = len(text)
+        best = [None] * (n + 1)  # best[i] = (jumlah potongan, awal potongan, pengganti)
+        best[0] = (0, 0, None)
+        for start in range(n):
+            if best[start] is None:
+                continue
+            node, count = self.trie, best[start][0] + 1
+            for end in range(start, n):
+                if end == start or text[end] != text[end - 1]:
+                    node = node.get(text[end])
+                    if node is None:
+                        break
+                value = node.get(_END)
+                if value is not None and (best[end + 1] is None or count < best[end + 1][0]):
+                    best[end + 1] = (count, start, value)
+        if best[n] is None:
+            return None
+        pieces, i = [], n
+        while i:
+            _, start, value = best[i]
+            pieces.append(value)
+            i = start
+        return pieces[::-1]
@@ -0,0 +1,33 @@
+# ============================================================
+# 🔌 modules/api_client.py — Klien untuk service HTTP ETHICATOR
+# ============================================================
+import json
+import urllib.request
+
+
+def _post(url, payload, timeout):
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.load(response)
+
+
+def predict_remote(text, base_url, timeout=10):
+    """Sama seperti predict_labels, tetapi dihitung oleh service ``python -m ethicator serve``."""
+    return _post(base_url.rstrip("/") + "/predict", {"text": text}, timeout)["labels"]
+
+
+def predict_remote_batch(texts, base_url, timeout=60):
+    """Prediksi banyak komentar lewat endpoint /predict_batch."""
+    return _post(base_url.rstrip("/") + "/predict_batch", {"texts": list(texts)}, timeout)["results"]
+
+
+def preprocess_remote_batch(texts, base_url, timeout=60, chunk=1000):
+    """Teks bersih (seperti load_resources()(text)) dari endpoint /preprocess, per ``chunk`` teks."""
+    texts, clean = list(texts), []
+    for start in range(0, len(texts), chunk):
+        clean += _post(base_url.rstrip("/") + "/preprocess", {"texts": texts[start:start + chunk]}, timeout)["clean"]
+    return clean
@@ -0,0 +1,269 @@
+# ============================================================
+# 🌐 modules/api_server.py — Service HTTP asyncio dengan micro-batching
+# ============================================================
+"""Service inferensi lokal berbasis asyncio (tanpa dependency tambahan).
+
+Endpoint:
+    POST /predict        {"text": "..."}          → {"labels": {...}}
+    POST /predict_batch  {"texts": ["...", ...]}  → {"results": [{...}, ...]}
+    POST /preprocess     {"texts": ["...", ...]}  → {"clean": ["...", ...]} (teks bersih untuk indeks kata)
+    GET  /metrics        metrik Prometheus (latensi, ukuran batch, tahap jika ETHICATOR_PROFILE=1)
+    GET  /health         status service
+
+Request yang datang bersamaan digabung menjadi satu micro-batch sehingga
+vectorizer dan model cukup dipanggil sekali per batch.
+"""
+import asyncio
+import json
+import time
+
+from modules.metrics import Counter, Histogram, render_prometheus
+from modules.profiling import PROFILER
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 414: "URI Too Long", 431: "Request Header Fields Too Large",
+            500: "Internal Server Error"}
+MAX_BODY = 10 * 1024 * 1024
+# Satu baris request/header dibatasi limit StreamReader (64 KiB); jumlah header dibatasi di sini
+MAX_HEADERS = 100
+
+
+def _json_results(results):
+    """Hasil predict_labels → struktur yang bisa di-JSON-kan (np.float64 → float)."""
+    return {
+        label: {"Probability": None if info["Probability"] is None else float(info["Probability"]),
+                "Status": info["Status"]}
+        for label, info in results.items()
+    }
+
+
+async def _read_head(reader):
+    """Baca request line + header → ``(request_line, headers, error)``.
+
+    ``error`` berisi ``(status, payload)`` jika satu baris melebihi limit
+    StreamReader (64 KiB; readline melempar ValueError) atau jumlah header
+    melebihi MAX_HEADERS; koneksi lalu dijawab 4xx dan ditutup.
+    """
+    headers = {}
+    try:
+        request_line = await reader.readline()
+    except ValueError:
+        return b"", headers, (414, b'{"error": "request line terlalu panjang"}')
+    if not request_line:
+        return request_line, headers, None
+    while True:
+        try:
+            line = await reader.readline()
+        except ValueError:
+            return request_line, headers, (431, b'{"error": "header terlalu panjang"}')
+        if line in (b"\r\n", b"\n", b""):
+            return request_line, headers, None
+        if len(headers) >= MAX_HEADERS:
+            return request_line, headers, (431, b'{"error": "header terlalu banyak"}')
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+
+class MicroBatcher:
+    """Kumpulkan teks dari banyak request lalu skor sekaligus di thread executor."""
+
+    def __init__(self, predict_batch, max_batch=128, max_wait=0.005):
+        self.predict_batch = predict_batch
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.queue = asyncio.Queue()
+        self.batch_size = Histogram(
+            "ethicator_batch_size", "Jumlah komentar per micro-batch.",
+            buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024),
+        )
+        self.batch_latency = Histogram("ethicator_batch_seconds", "Waktu skoring satu micro-batch.")
+
+    async def submit(self, texts):
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((texts, future))
+        return await future
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            jobs = [await self.queue.get()]
+            size = len(jobs[0][0])
+            deadline = loop.time() + self.max_wait
+            while size < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    job = await asyncio.wait_for(self.queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                jobs.append(job)
+                size += len(job[0])
+
+            texts = [text for job_texts, _ in jobs for text in job_texts]
+            start = time.perf_counter()
+            try:
+                results = await loop.run_in_executor(None, self.predict_batch, texts)
+            except Exception as exc:
+                for _, future in jobs:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            self.batch_latency.observe(time.perf_counter() - start)
+            self.batch_size.observe(len(texts))
+
+            offset = 0
+            for job_texts, future in jobs:
+                if not future.done():
+                    future.set_result(results[offset:offset + len(job_texts)])
+                offset += len(job_texts)
+
+
+class InferenceService:
+    """Server HTTP/1.1 minimal di atas ``asyncio.start_server``."""
+
+    def __init__(self, predict_batch, max_batch=128, max_wait=0.005, preprocess_batch=None):
+        self.batcher = MicroBatcher(predict_batch, max_batch, max_wait)
+        self.preprocess_batch = preprocess_batch
+        self.latency = {
+            path: Histogram("ethicator_request_seconds", "Latensi request HTTP.", labels={"path": path})
+            for path in ("/predict", "/predict_batch", "/preprocess")
+        }
+        self.errors = Counter("ethicator_request_errors_total", "Request yang gagal (status >= 400).")
+
+    def metrics_text(self):
+        return render_prometheus([
+            *self.latency.values(), self.batcher.batch_latency, self.batcher.batch_size, self.errors,
+            *(PROFILER.metrics() if PROFILER.enabled else ()),
+        ])
+
+    async def handle(self, method, path, body):
+        """Routing satu request → (status, content_type, payload bytes)."""
+        if path == "/health":
+            return 200, "application/json", b'{"status": "ok"}'
+        if path == "/metrics":
+            return 200, "text/plain; version=0.0.4", self.metrics_text().encode()
+        if path not in self.latency or (path == "/preprocess" and self.preprocess_batch is None):
+            return 404, "application/json", b'{"error": "not found"}'
+        if method != "POST":
+            return 405, "application/json", b'{"error": "gunakan POST"}'
+
+        try:
+            payload = json.loads(body or b"{}")
+            if path == "/predict":
+                texts = [payload["text"]]
+            else:
+                texts = payload["texts"]
+            if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+                raise TypeError("text harus string, texts harus list string")
+        except (ValueError, KeyError, TypeError):
+            return 400, "application/json", b'{"error": "body JSON tidak valid"}'
+
+        start = time.perf_counter()
+        if path == "/preprocess":
+            clean = await asyncio.get_running_loop().run_in_executor(None, self.preprocess_batch, texts)
+            self.latency[path].observe(time.perf_counter() - start)
+            return 200, "application/json", json.dumps({"clean": clean}, ensure_ascii=False).encode()
+        results = await self.batcher.submit(texts) if texts else []
+        self.latency[path].observe(time.perf_counter() - start)
+
+        if path == "/predict":
+            data = {"text": texts[0], "labels": _json_results(results[0])}
+        else:
+            data = {"results": [_json_results(r) for r in results]}
+        return 200, "application/json", json.dumps(data, ensure_ascii=False).encode()
+
+    async def serve_connection(self, reader, writer):
+        try:
+            while True:
+                request_line, headers, head_error = await _read_head(reader)
+                if head_error is None:
+                    if not request_line:
+                        break
+                    try:
+                        method, target, version = request_line.decode("latin-1").split()
+                    except ValueError:
+                        break
+
+                try:
+                    length = int(headers.get("content-length") or 0)
+                except ValueError:
+                    length = -1
+                if head_error is not None:
+                    (status, payload), ctype = head_error, "application/json"
+                    keep_alive = False
+                elif length < 0:
+                    status, ctype, payload = 400, "application/json", b'{"error": "Content-Length tidak valid"}'
+                    keep_alive = False
+                elif length > MAX_BODY:
+                    status, ctype, payload = 413, "application/json", b'{"error": "body terlalu besar"}'
+                    keep_alive = False
+                else:
+                    body = await reader.readexactly(length) if length else b""
+                    try:
+                        status, ctype, payload = await self.handle(method, target.split("?")[0], body)
+                    except Exception:
+                        status, ctype, payload = 500, "application/json", b'{"error": "internal"}'
+                    keep_alive = (headers.get("connection", "").lower() != "close"
+                                  and version == "HTTP/1.1")
+                if status >= 400:
+                    self.errors.inc()
+
+                writer.write(
+                    f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                    f"Content-Type: {ctype}\r\n"
+                    f"Content-Length: {len(payload)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode()
+                    + payload
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=8000):
+        batch_task = asyncio.create_task(self.batcher.run())
+        server = await asyncio.start_server(self.serve_connection, host, port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            batch_task.cancel()
+
+
+def build_predict_batch():
+    """Load model & resource sekali, kembalikan fungsi list teks → list hasil."""
+    from utils import batch_to_results, load_predictor, predict_labels_batch
+
+    models, vectorizers, preprocessor, feature_index = load_predictor()
+
+    def predict_batch(texts):
+        probs = predict_labels_batch(texts, models, vectorizers, preprocessor, feature_index)
+        return batch_to_results(probs)
+
+    return predict_batch
+
+
+def build_preprocess_batch():
+    """Fungsi list teks mentah → list teks bersih (Preprocessor dari load_resources)."""
+    from utils import load_resources
+
+    preprocessor = load_resources()
+
+    def preprocess_batch(texts):
+        return [preprocessor(text) for text in texts]
+
+    return preprocess_batch
+
+
+def run(host="127.0.0.1", port=8000, max_batch=128, max_wait=0.005):
+    service = InferenceService(build_predict_batch(), max_batch=max_batch, max_wait=max_wait,
+                               preprocess_batch=build_preprocess_batch())
+    print(f"🌐 ETHICATOR API di http://{host}:{port} (POST /predict, /predict_batch, /preprocess; GET /metrics)")
+    try:
+        asyncio.run(service.serve(host, port))
+    except KeyboardInterrupt:
+        pass
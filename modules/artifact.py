@@ -0,0 +1,251 @@
+# ============================================================
+# 📦 modules/artifact.py — Format artifact model tanpa pickle (npy + JSON)
+# ============================================================
+"""Ekspor ``models/models.pkl`` ke direktori artifact yang bisa di-memory-map.
+
+Isi direktori:
+    meta.json       label, parameter tokenisasi & TF-IDF, offset tiap label,
+                    serta sha256 pickle sumber
+    vocab.npy       vocabulary gabungan terurut (bytes UTF-8 lebar tetap)
+    columns.npy     indeks kolom gabungan tiap label, disambung berurutan
+    idf.npy         vektor idf tiap label, disambung dengan offset yang sama
+    coef.npy        koefisien regresi logistik tiap label, offset yang sama
+    intercept.npy   intercept per label (urut sesuai ``labels``)
+    fused_*.npy     FusedLinearScorer yang sudah dikompilasi: ``indices`` &
+                    ``indptr`` CSR (n_term × n_label) bersama, ``weights``
+                    (idf × coef) dan ``idf_sq`` (idf²) sebagai data-nya
+
+Loader membuka semua .npy dengan ``mmap_mode="r"`` dan startup tidak
+melakukan unpickling. Matriks scorer gabungan dibungkus langsung di atas
+array mmap tanpa disalin, sehingga jalur panas prediksi di beberapa proses
+worker membaca page yang sama. Vocabulary tetap di-decode menjadi dict
+Python per proses (dibutuhkan CountVectorizer).
+"""
+import hashlib
+import json
+import os
+import pickle
+from collections.abc import Mapping
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+
+import scipy.sparse as sp
+
+from modules.inference import FusedLinearScorer, SharedFeatureIndex
+
+ARTIFACT_DIR = "models/artifact"
+FORMAT_VERSION = 2
+FUSED_ARRAYS = ("fused_indices", "fused_indptr", "fused_weights", "fused_idf_sq")
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def export_artifact(pickle_path="models/models.pkl", out_dir=ARTIFACT_DIR):
+    """Tulis artifact dari pickle sumber. Hanya model regresi logistik biner yang didukung."""
+    with open(pickle_path, "rb") as f:
+        data = pickle.load(f)
+    models, vectorizers = data["models"], data["vectorizers"]
+    index = SharedFeatureIndex.from_vectorizers(vectorizers)
+    labels = list(models)
+
+    for name, value in index.analyzer_params.items():
+        if callable(value):
+            raise ValueError(f"Parameter vectorizer {name!r} berupa fungsi, tidak bisa diekspor ke JSON.")
+
+    offsets, columns, idf, coef, intercept, tfidf = {}, [], [], [], [], {}
+    start = 0
+    for label in labels:
+        model, vec = models[label], vectorizers[label]
+        if not isinstance(model, LogisticRegression) or len(model.classes_) != 2:
+            raise ValueError(f"Model {label} bukan regresi logistik biner.")
+        cols = index.columns[label]
+        offsets[label] = [start, start + len(cols)]
+        start += len(cols)
+        columns.append(cols)
+        idf.append(vec.idf_ if vec.use_idf else np.ones(len(cols)))
+        coef.append(model.coef_[0])
+        intercept.append(model.intercept_[0])
+        tfidf[label] = {
+            "sublinear_tf": vec.sublinear_tf,
+            "norm": vec.norm,
+            "use_idf": vec.use_idf,
+            "smooth_idf": vec.smooth_idf,
+            "classes": [int(c) for c in model.classes_],
+        }
+
+    os.makedirs(out_dir, exist_ok=True)
+    vocab = np.array([t.encode("utf-8") for t in index.terms])
+    arrays = {
+        "vocab": vocab,
+        "columns": np.concatenate(columns).astype(np.int32),
+        "idf": np.concatenate(idf).astype(np.float64),
+        "coef": np.concatenate(coef).astype(np.float64),
+        "intercept": np.array(intercept, dtype=np.float64),
+    }
+    fused = _fused_arrays(index, models)
+    if fused is not None:
+        arrays.update(fused)
+    for name, array in arrays.items():
+        np.save(os.path.join(out_dir, f"{name}.npy"), array)
+
+    params = dict(index.analyzer_params)
+    params["ngram_range"] = list(params["ngram_range"])
+    meta = {
+        "format_version": FORMAT_VERSION,
+        "source": {"path": pickle_path, "sha256": file_sha256(pickle_path)},
+        "labels": labels,
+        "dtype": np.dtype(index.dtype).name,
+        "analyzer_params": params,
+        "tfidf": tfidf,
+        "offsets": offsets,
+        "fused": None if fused is None else {
+            "sublinear_tf": index.scorer.sublinear_tf, "norm": index.scorer.norm,
+            "shape": list(index.scorer.weights.shape),
+        },
+    }
+    # meta.json ditulis terakhir: artifact dianggap lengkap hanya jika file ini ada
+    with open(os.path.join(out_dir, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=1)
+    return meta
+
+
+def _fused_arrays(index, models):
+    """Array CSR scorer gabungan untuk disimpan, atau None jika model tidak bisa digabung."""
+    try:
+        scorer = index.compile(models)
+    except ValueError:
+        return None
+    weights, idf_sq = scorer.weights, scorer.idf_sq
+    weights.sort_indices()
+    idf_sq.sort_indices()
+    if not (np.array_equal(weights.indices, idf_sq.indices) and np.array_equal(weights.indptr, idf_sq.indptr)):
+        raise ValueError("Struktur sparse bobot dan idf² berbeda.")
+    return {
+        "fused_indices": weights.indices.astype(np.int32),
+        "fused_indptr": weights.indptr.astype(np.int32),
+        "fused_weights": weights.data.astype(np.float64),
+        "fused_idf_sq": idf_sq.data.astype(np.float64),
+    }
+
+
+def load_vocabulary(artifact_dir=ARTIFACT_DIR):
+    """Term unigram vocabulary gabungan model (list str); kosong jika artifact belum ada."""
+    path = os.path.join(artifact_dir, "vocab.npy")
+    if not os.path.exists(path):
+        return []
+    terms = (t.decode("utf-8") for t in np.load(path, mmap_mode="r").tolist())
+    return [t for t in terms if " " not in t]
+
+
+def artifact_is_current(artifact_dir=ARTIFACT_DIR, pickle_path="models/models.pkl"):
+    """True jika artifact ada dan dibuat dari pickle yang sama (atau pickle tidak ada)."""
+    meta_path = os.path.join(artifact_dir, "meta.json")
+    if not os.path.exists(meta_path):
+        return False
+    with open(meta_path, encoding="utf-8") as f:
+        meta = json.load(f)
+    if meta.get("format_version") != FORMAT_VERSION:
+        return False
+    if not os.path.exists(pickle_path):
+        return True
+    return meta["source"]["sha256"] == file_sha256(pickle_path)
+
+
+class LazyVectorizers(Mapping):
+    """Mapping label → TfidfVectorizer yang baru dibangun saat diakses.
+
+    Jalur utama prediksi memakai SharedFeatureIndex; vectorizer per label hanya
+    dibutuhkan untuk jalur cadangan atau pemeriksaan paritas.
+    """
+
+    def __init__(self, index, meta, idf):
+        self._index = index
+        self._meta = meta
+        self._idf = idf
+        self._built = {}
+
+    def __getitem__(self, label):
+        if label not in self._built:
+            settings = self._meta["tfidf"][label]
+            params = dict(self._meta["analyzer_params"], ngram_range=tuple(self._meta["analyzer_params"]["ngram_range"]))
+            vec = TfidfVectorizer(
+                **params,
+                dtype=np.dtype(self._meta["dtype"]).type,
+                norm=settings["norm"],
+                use_idf=settings["use_idf"],
+                smooth_idf=settings["smooth_idf"],
+                sublinear_tf=settings["sublinear_tf"],
+            )
+            terms = self._index.terms
+            vec.vocabulary_ = {terms[c]: j for j, c in enumerate(self._index.columns[label])}
+            if settings["use_idf"]:
+                start, end = self._meta["offsets"][label]
+                vec.idf_ = np.asarray(self._idf[start:end])
+            self._built[label] = vec
+        return self._built[label]
+
+    def __iter__(self):
+        return iter(self._meta["labels"])
+
+    def __len__(self):
+        return len(self._meta["labels"])
+
+
+def _logistic(coef, intercept, classes):
+    """LogisticRegression siap pakai dari array (tanpa fit, tanpa pickle)."""
+    model = LogisticRegression()
+    model.coef_ = coef.reshape(1, -1)
+    model.intercept_ = np.array([intercept])
+    model.classes_ = np.array(classes)
+    model.n_features_in_ = coef.shape[0]
+    return model
+
+
+def load_artifact(artifact_dir=ARTIFACT_DIR, mmap=True):
+    """Load artifact → (models, vectorizers, feature_index), sama seperti load_models."""
+    with open(os.path.join(artifact_dir, "meta.json"), encoding="utf-8") as f:
+        meta = json.load(f)
+
+    mode = "r" if mmap else None
+
+    def array(name):
+        return np.load(os.path.join(artifact_dir, f"{name}.npy"), mmap_mode=mode)
+
+    vocab, columns, idf, coef, intercept = (
+        array(name) for name in ("vocab", "columns", "idf", "coef", "intercept")
+    )
+    terms = [t.decode("utf-8") for t in vocab.tolist()]
+
+    label_columns, tfidf, models = {}, {}, {}
+    for j, label in enumerate(meta["labels"]):
+        start, end = meta["offsets"][label]
+        settings = meta["tfidf"][label]
+        label_columns[label] = columns[start:end]
+        tfidf[label] = (
+            settings["sublinear_tf"],
+            idf[start:end] if settings["use_idf"] else None,
+            settings["norm"],
+        )
+        models[label] = _logistic(coef[start:end], intercept[j], settings["classes"])
+
+    params = dict(meta["analyzer_params"], ngram_range=tuple(meta["analyzer_params"]["ngram_range"]))
+    index = SharedFeatureIndex(terms, label_columns, tfidf, params, dtype=np.dtype(meta["dtype"]).type)
+    fused = meta.get("fused")
+    if fused is not None:
+        indices, indptr, weights, idf_sq = (array(name) for name in FUSED_ARRAYS)
+        shape = tuple(fused["shape"])
+        index.scorer = FusedLinearScorer.from_matrices(
+            meta["labels"],
+            sp.csr_matrix((weights, indices, indptr), shape=shape, copy=False),
+            sp.csr_matrix((idf_sq, indices, indptr), shape=shape, copy=False),
+            np.asarray(intercept), fused["sublinear_tf"], fused["norm"],
+        )
+    return models, LazyVectorizers(index, meta, idf), index
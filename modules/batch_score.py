@@ -0,0 +1,90 @@
+# ============================================================
+# 🏭 modules/batch_score.py — Skoring CSV besar dengan process pool
+# ============================================================
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+# Resource per proses worker, diisi sekali oleh _init_worker
+_WORKER = {}
+
+
+def _init_worker(fast=False, cascade_gate=None):
+    """Load models.pkl dan resource preprocessing (+ pre-screen jika fast) sekali per proses."""
+    import streamlit.logger
+
+    from utils import load_predictor, load_prescreen
+
+    streamlit.logger.set_log_level("error")  # mode bare, tanpa runtime Streamlit
+    models, vectorizers, preprocessor, feature_index = load_predictor()
+    _WORKER.update(
+        preprocessor=preprocessor,
+        models=models,
+        vectorizers=vectorizers,
+        feature_index=feature_index,
+        prescreen=load_prescreen() if fast else None,
+        cascade_gate=cascade_gate,
+    )
+
+
+def score_frame(df, text_column, fast=False, cascade_gate=None):
+    """Tambahkan kolom ``<label>_Prob`` dan ``<label>_Status`` ke satu chunk."""
+    from utils import batch_statuses, predict_labels_batch
+
+    if not _WORKER:
+        _init_worker(fast, cascade_gate)
+    texts = df[text_column].fillna("").astype(str)
+    probs = predict_labels_batch(
+        texts, _WORKER["models"], _WORKER["vectorizers"],
+        _WORKER["preprocessor"], _WORKER["feature_index"], _WORKER["prescreen"],
+        _WORKER["cascade_gate"],
+    )
+    statuses = batch_statuses(probs)
+
+    out = df.copy()
+    for label in probs.columns:
+        out[f"{label}_Prob"] = probs[label].round(2)
+        out[f"{label}_Status"] = statuses[label]
+    return out
+
+
+def score_csv(in_path, out_path, workers=None, chunksize=10_000,
+              text_column="Tweet", encoding="utf-8", log=print, fast=False, cascade_gate=None):
+    """Skor CSV secara streaming: chunk dibaca, diskor paralel, lalu ditulis berurutan.
+
+    Paling banyak ``2 × workers`` chunk berada di memori sekaligus, sehingga
+    pemakaian memori tetap terbatas berapa pun ukuran file input. ``fast``
+    mengaktifkan pre-screen leksikon (komentar yang lolos tidak diskor model;
+    recall HS turun, lihat modules/prescreen.py);
+    ``cascade_gate`` hanya menskor sub-label HS bila probabilitas HS ≥ gate.
+    """
+    workers = workers or os.cpu_count() or 1
+    reader = pd.read_csv(in_path, chunksize=chunksize, encoding=encoding)
+    start = time.perf_counter()
+    rows = 0
+
+    with open(out_path, "w", encoding="utf-8", newline="") as out:
+        def write(frame):
+            nonlocal rows
+            frame.to_csv(out, header=rows == 0, index=False)
+            out.flush()
+            rows += len(frame)
+            elapsed = time.perf_counter() - start
+            log(f"{rows} baris ({rows / elapsed:,.0f} baris/detik)")
+
+        if workers == 1:
+            for chunk in reader:
+                write(score_frame(chunk, text_column, fast, cascade_gate))
+            return rows
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(fast, cascade_gate)) as pool:
+            pending = []
+            for chunk in reader:
+                pending.append(pool.submit(score_frame, chunk, text_column, fast, cascade_gate))
+                if len(pending) >= 2 * workers:
+                    write(pending.pop(0).result())
+            for future in pending:
+                write(future.result())
+    return rows
@@ -0,0 +1,139 @@
+# ============================================================
+# 🧹 modules/corpus.py — Preprocessing korpus training dengan cache per isi
+# ============================================================
+"""Jalankan ``preprocess`` atas ``data/data.csv`` sekali, lalu pakai ulang.
+
+Setiap tweet diberi kunci ``sha1(fingerprint resource + teks mentah)``. Cache
+kunci → teks bersih disimpan di ``data/cache/``; saat dijalankan ulang hanya
+baris yang kuncinya belum ada (teks baru/berubah, atau kamus alay/stopword
+berubah) yang di-preprocess, paralel dengan process pool.
+
+Subset seimbang per label (seperti ``data_balance/``) diturunkan dari satu
+tabel bersih ini, bukan dari 12 salinan teks terpisah.
+"""
+import hashlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from modules.log_store import LOG_LABELS
+
+RAW_PATH = "data/data.csv"
+CACHE_DIR = "data/cache"
+RESOURCE_PATHS = ("data/new_kamusalay.csv", "data/stopwordbahasa.csv")
+
+try:
+    import pyarrow  # noqa: F401
+    TABLE_EXT = ".parquet"
+except ImportError:
+    TABLE_EXT = ".csv"
+
+CACHE_PATH = os.path.join(CACHE_DIR, "clean_cache" + TABLE_EXT)
+CLEAN_PATH = os.path.join(CACHE_DIR, "data_clean" + TABLE_EXT)
+
+# Preprocessor per proses worker, diisi sekali oleh _init_worker
+_WORKER = {}
+
+
+def read_table(path):
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path)
+    return pd.read_csv(path, dtype={"key": str, "clean": str}, keep_default_na=False)
+
+
+def write_table(df, path):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    if path.endswith(".parquet"):
+        df.to_parquet(tmp_path, index=False)
+    else:
+        df.to_csv(tmp_path, index=False, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def resource_fingerprint(paths=RESOURCE_PATHS):
+    """Hash isi kamus alay & stopword (+ mode alay perkiraan): jika berubah, semua teks bersih dianggap usang."""
+    from utils import FUZZY_ALAY
+
+    digest = hashlib.sha1()
+    for path in paths:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    if FUZZY_ALAY:
+        digest.update(b"fuzzy-alay")  # tanpa mode ini fingerprint sama dengan sebelumnya
+    return digest.hexdigest()
+
+
+def row_keys(texts, fingerprint):
+    prefix = fingerprint.encode() + b"\0"
+    return [hashlib.sha1(prefix + text.encode("utf-8")).hexdigest() for text in texts]
+
+
+def _init_worker():
+    import streamlit.logger
+
+    from utils import load_resources
+
+    streamlit.logger.set_log_level("error")  # mode bare, tanpa runtime Streamlit
+    _WORKER["preprocessor"] = load_resources()
+
+
+def _clean_chunk(texts):
+    if not _WORKER:
+        _init_worker()
+    preprocessor = _WORKER["preprocessor"]
+    return [preprocessor(text) for text in texts]
+
+
+def preprocess_corpus(raw_path=RAW_PATH, cache_path=CACHE_PATH, clean_path=CLEAN_PATH,
+                      workers=None, chunksize=1000, encoding="latin-1", log=print):
+    """Bangun tabel bersih (kolom ``key``, ``Tweet``, ``clean`` + 12 label) dari CSV mentah."""
+    raw = pd.read_csv(raw_path, encoding=encoding)
+    raw["Tweet"] = raw["Tweet"].fillna("").astype(str)
+    raw.insert(0, "key", row_keys(raw["Tweet"], resource_fingerprint()))
+
+    cache = {}
+    if os.path.exists(cache_path):
+        cached = read_table(cache_path)
+        cache = dict(zip(cached["key"], cached["clean"]))
+
+    cached = raw["key"].isin(cache.keys())
+    missing = raw[~cached].drop_duplicates("key")
+    log(f"{len(raw)} baris: {int(cached.sum())} dari cache, {len(missing)} teks unik perlu di-preprocess")
+
+    if len(missing):
+        start = time.perf_counter()
+        texts = missing["Tweet"].tolist()
+        chunks = [texts[i:i + chunksize] for i in range(0, len(texts), chunksize)]
+        workers = workers or os.cpu_count() or 1
+        if workers == 1:
+            cleaned = [_clean_chunk(chunk) for chunk in chunks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+                cleaned = list(pool.map(_clean_chunk, chunks))
+        cache.update(zip(missing["key"], (text for chunk in cleaned for text in chunk)))
+        log(f"{len(missing)} baris di-preprocess dalam {time.perf_counter() - start:.1f} s")
+        write_table(pd.DataFrame({"key": list(cache), "clean": list(cache.values())}), cache_path)
+
+    raw.insert(2, "clean", raw["key"].map(cache))
+    write_table(raw, clean_path)
+    return raw
+
+
+def balanced_subsets(clean, labels=None, random_state=42):
+    """Label → DataFrame(``Tweet`` bersih, label) dengan jumlah positif = negatif.
+
+    Semua baris positif dipakai; negatif diambil acak sebanyak jumlah positif
+    (undersampling), sama seperti isi ``data_balance/``. Teks kosong dibuang.
+    """
+    clean = clean[clean["clean"].str.strip() != ""]
+    subsets = {}
+    for label in labels or [c for c in LOG_LABELS if c in clean.columns]:
+        positive = clean[clean[label] == 1]
+        negative = clean[clean[label] == 0]
+        negative = negative.sample(n=min(len(positive), len(negative)), random_state=random_state)
+        subset = pd.concat([positive, negative])[["clean", label]].rename(columns={"clean": "Tweet"})
+        subsets[label] = subset.reset_index(drop=True)
+    return subsets
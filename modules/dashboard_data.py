@@ -0,0 +1,61 @@
+# ============================================================
+# 📦 modules/dashboard_data.py — Data Ethics Dashboard dalam satu snapshot
+# ============================================================
+"""Semua angka yang dibutuhkan Ethics Dashboard, diambil sekali per versi data.
+
+``load_dashboard_data`` tidak bergantung pada Streamlit; tab dashboard
+membungkusnya dengan ``st.cache_data`` memakai kunci ``data_version`` (mtime
+file database + WAL) dan counter ``dashboard_refresh`` dari Self Reflection,
+sehingga interaksi widget lain tidak memicu query ulang.
+"""
+import os
+from dataclasses import dataclass
+from datetime import timedelta
+
+import pandas as pd
+
+from modules.storage import TIMESTAMP_FORMAT
+
+
+@dataclass
+class DashboardData:
+    total_comments: int
+    daily_points: int
+    weekly_points: int
+    yesterday_points: int
+    status: dict
+    recent: pd.DataFrame
+    emotions: pd.DataFrame
+    labels: pd.DataFrame
+    top_words: list
+
+
+def data_version(store):
+    """Versi data berbasis mtime: berubah setiap ada transaksi yang ditulis (termasuk ke -wal)."""
+    stamps = []
+    for suffix in ("", "-wal"):
+        try:
+            stamps.append(os.stat(store.path + suffix).st_mtime_ns)
+        except FileNotFoundError:
+            stamps.append(0)
+    return tuple(stamps)
+
+
+def load_dashboard_data(store, username, today, recent_limit=10, max_words=200):
+    """Ambil snapshot dashboard untuk ``username`` pada tanggal ``today`` (objek date)."""
+    recent = store.recent_activities(limit=recent_limit, username=username)
+    # Tanggal disimpan dengan format tetap, jadi cukup di-parse sekali dengan format eksplisit
+    recent["Tanggal"] = pd.to_datetime(recent["Tanggal"], format=TIMESTAMP_FORMAT).dt.date
+
+    status = store.status_counts(username)
+    return DashboardData(
+        total_comments=status["total"],
+        daily_points=store.points_between(today, today, username),
+        weekly_points=store.points_between(today - timedelta(days=6), today, username),
+        yesterday_points=store.points_between(today - timedelta(days=1), today - timedelta(days=1), username),
+        status=status,
+        recent=recent,
+        emotions=store.emotion_counts(username),
+        labels=store.label_counts(username),
+        top_words=store.top_words(max_words, username),
+    )
@@ -0,0 +1,42 @@
+# ============================================================
+# 📒 modules/log_store.py — Skema log & pembaca CSV lama (migrasi ke SQLite)
+# ============================================================
+"""Skema kolom log aktivitas dan pembaca file CSV lama.
+
+Aktivitas dan skor sekarang disimpan di SQLite (modules/storage.py); tidak
+ada lagi yang menulis ke CSV. Modul ini hanya menyimpan urutan label/kolom
+yang dipakai bersama dan pembaca untuk ``ActivityStore.migrate_csv``.
+"""
+import os
+
+import pandas as pd
+
+# Urutan label tetap agar kolom log stabil walaupun model dilatih ulang
+LOG_LABELS = [
+    "HS", "Abusive", "HS_Individual", "HS_Group", "HS_Religion", "HS_Race",
+    "HS_Physical", "HS_Gender", "HS_Other", "HS_Weak", "HS_Moderate", "HS_Strong",
+]
+ETHICS_LOG_COLUMNS = [
+    "Tanggal", "Komentar", "Emosi", "Kesalahan/Tantangan", "Rencana Perbaikan",
+    "Status Etika", "Feedback", "Poin",
+] + [f"{label}_{field}" for label in LOG_LABELS for field in ("Prob", "Status")]
+SCORE_COLUMNS = ["Tanggal", "Total_Skor"]
+# Status label yang sengaja tidak dievaluasi model (pre-screen leksikon / cascade); probabilitasnya None
+SKIPPED_STATUS = "⚪ Tidak Dievaluasi"
+
+ETHICS_LOG_PATH = "data/personal_ethics_log.csv"
+SCORE_LOG_PATH = "data/personal_scores.csv"
+
+
+def read_csv_log(path, columns):
+    """Baca log CSV lama sebagai DataFrame; kosong (dengan ``columns``) jika file tidak ada."""
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return pd.DataFrame(columns=list(columns))
+    return pd.read_csv(path, encoding="utf-8")
+
+
+def latest_scores(path=SCORE_LOG_PATH):
+    """Skor harian terkini: baris terakhir per tanggal menang, baris reset (skor kosong) dibuang."""
+    df = read_csv_log(path, SCORE_COLUMNS)
+    df = df.drop_duplicates(subset="Tanggal", keep="last")
+    return df.dropna(subset=["Total_Skor"]).reset_index(drop=True)
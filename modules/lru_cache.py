@@ -0,0 +1,69 @@
+# ============================================================
+# 🗃️ modules/lru_cache.py — Cache LRU berbatas dengan penghitung hit/miss
+# ============================================================
+import threading
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Cache LRU thread-safe dengan ukuran maksimum yang bisa diatur.
+
+    Entri yang paling lama tidak dipakai dibuang saat cache penuh.
+    ``maxsize=0`` mematikan cache (semua lookup dihitung miss).
+    """
+
+    def __init__(self, maxsize=4096):
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.maxsize = max(int(maxsize), 0)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def resize(self, maxsize):
+        """Ubah ukuran maksimum; entri terlama dibuang jika melebihi ukuran baru."""
+        with self._lock:
+            self.maxsize = max(int(maxsize), 0)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """Ringkasan cache: hits, misses, hit_rate, size, maxsize."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+            }
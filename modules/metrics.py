@@ -0,0 +1,96 @@
+# ============================================================
+# 📈 modules/metrics.py — Histogram & counter sederhana (format Prometheus)
+# ============================================================
+import bisect
+import threading
+
+# Bucket default (detik) untuk latensi: 0.5 ms … 10 s
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Histogram bucket tetap yang thread-safe, seperti histogram Prometheus."""
+
+    def __init__(self, name, help_text, buckets=LATENCY_BUCKETS, labels=None):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(sorted(buckets))
+        self.labels = dict(labels or {})
+        self._counts = [0] * (len(self.buckets) + 1)  # slot terakhir = +Inf
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[i] += 1
+            self._sum += value
+
+    @property
+    def count(self):
+        return sum(self._counts)
+
+    def quantile(self, q):
+        """Perkiraan kuantil dari batas atas bucket (None jika belum ada data)."""
+        with self._lock:
+            counts = list(self._counts)
+        total = sum(counts)
+        if not total:
+            return None
+        target, running = q * total, 0
+        for bound, n in zip(self.buckets + (float("inf"),), counts):
+            running += n
+            if running >= target:
+                return bound
+        return float("inf")
+
+    def samples(self):
+        """Baris sampel Prometheus (_bucket kumulatif, _sum, _count)."""
+        with self._lock:
+            counts, total_sum = list(self._counts), self._sum
+        lines, running = [], 0
+        for bound, n in zip(self.buckets + (float("inf"),), counts):
+            running += n
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(f"{self.name}_bucket{_fmt_labels(self.labels, le=le)} {running}")
+        lines.append(f"{self.name}_sum{_fmt_labels(self.labels)} {total_sum}")
+        lines.append(f"{self.name}_count{_fmt_labels(self.labels)} {running}")
+        return lines
+
+
+class Counter:
+    """Counter monoton yang thread-safe."""
+
+    def __init__(self, name, help_text, labels=None):
+        self.name = name
+        self.help_text = help_text
+        self.labels = dict(labels or {})
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+
+    def samples(self):
+        return [f"{self.name}{_fmt_labels(self.labels)} {self.value}"]
+
+
+def _fmt_labels(labels, **extra):
+    items = {**labels, **extra}
+    if not items:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in items.items()) + "}"
+
+
+def render_prometheus(metrics):
+    """Gabungkan metrik menjadi teks exposition Prometheus (HELP/TYPE sekali per nama)."""
+    lines, seen = [], set()
+    for metric in metrics:
+        if metric.name not in seen:
+            seen.add(metric.name)
+            kind = "histogram" if isinstance(metric, Histogram) else "counter"
+            lines.append(f"# HELP {metric.name} {metric.help_text}")
+            lines.append(f"# TYPE {metric.name} {kind}")
+        lines.extend(metric.samples())
+    return "\n".join(lines) + "\n"
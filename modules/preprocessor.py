@@ -0,0 +1,144 @@
+# ============================================================
+# 🧹 modules/preprocessor.py — Pipeline preprocessing terkompilasi
+# ============================================================
+import re
+import time
+
+from Sastrawi.Stemmer.Filter import TextNormalizer
+
+from modules.profiling import PROFILER
+
+_SYMBOLS = re.compile('[^0-9a-zA-Z]+')
+_TAGS = re.compile(r'rt|user|www|https?://\S+')
+
+
+class Preprocessor:
+    """Versi cepat ``utils.preprocess`` dengan hasil yang identik.
+
+    - stopword disimpan sebagai frozenset (lookup O(1), bukan scan list);
+    - regex dikompilasi sekali di level modul;
+    - kamus alay dinormalisasi sekali di awal, sehingga teks cukup dipecah
+      satu kali dan tiap kata langsung di-stem lewat ``stemmer.stem_word``
+      (StemCache) tanpa normalisasi ulang satu kalimat oleh Sastrawi.
+
+    ``alay_index`` (opsional, modules/alay_index.py) dipakai hanya untuk token
+    yang tidak persis ada di kamus alay: huruf berulang & kata gabung.
+
+    Objek ini callable: ``preprocessor(text)`` mengembalikan teks bersih.
+    ``cache`` (LRUCache, opsional) dikunci teks mentah saja, jadi harus milik
+    satu Preprocessor; jangan dibagi dengan pipeline lain.
+    """
+
+    def __init__(self, alay_dict_map, stopword_list, stemmer, cache=None, alay_index=None):
+        self.alay_dict_map = alay_dict_map
+        self.alay_index = alay_index
+        self.stopwords = frozenset(stopword_list)
+        self.stemmer = stemmer
+        self.cache = cache
+        # Kata hasil normalisasi alay persis seperti yang akan dipecah Sastrawi
+        self._alay_words = {
+            key: [w for w in TextNormalizer.normalize_text(value).split(' ') if w]
+            for key, value in alay_dict_map.items()
+        }
+        self._stem_word = getattr(stemmer, 'stem_word', None)
+
+    def prestem(self, text):
+        """Lowercase, buang simbol & tag, normalisasi alay (sama dengan utils.prestem)."""
+        text = _TAGS.sub(' ', _SYMBOLS.sub(' ', text.lower()))
+        if self.alay_index is not None:
+            return ' '.join([self._alay_text(w) for w in text.split()])
+        return ' '.join([self.alay_dict_map.get(w, w) for w in text.split()])
+
+    def _alay_text(self, token):
+        """Padanan alay satu token: persis dari kamus, lalu perkiraan dari alay_index."""
+        value = self.alay_dict_map.get(token)
+        if value is None and self.alay_index is not None:
+            value = self.alay_index(token)
+        return token if value is None else value
+
+    def _approx_words(self, token):
+        """Kata pengganti perkiraan (sudah dinormalisasi seperti _alay_words), atau None."""
+        value = self.alay_index(token)
+        if value is None:
+            return None
+        return [w for w in TextNormalizer.normalize_text(value).split(' ') if w]
+
+    def __call__(self, text):
+        if PROFILER.enabled:
+            return self._profiled_call(text)
+        if self.cache is not None:
+            clean = self.cache.get(text)
+            if clean is None:
+                clean = self._clean(text)
+                self.cache.put(text, clean)
+            return clean
+        return self._clean(text)
+
+    def _clean(self, text):
+        if self._stem_word is None:
+            stemmed = self.stemmer.stem(self.prestem(text)).split()
+        else:
+            text = _TAGS.sub(' ', _SYMBOLS.sub(' ', text.lower()))
+            alay_words = self._alay_words
+            stem_word = self._stem_word
+            approx = None if self.alay_index is None else self._approx_words
+            stemmed = []
+            for token in text.split():
+                words = alay_words.get(token)
+                if words is None and approx is not None:
+                    words = approx(token)
+                if words is None:
+                    stemmed.append(stem_word(token))
+                else:
+                    stemmed.extend([stem_word(w) for w in words])
+
+        stopwords = self.stopwords
+        return ' '.join([w for w in stemmed if w and w not in stopwords])
+
+    # ------------------------------------------------------------
+    # Versi terinstrumentasi (hanya saat PROFILER.enabled)
+    # ------------------------------------------------------------
+    def _profiled_call(self, text):
+        with PROFILER.stage('preprocess'):
+            if self.cache is None:
+                return self._clean_profiled(text)
+            clean = self.cache.get(text)
+            if clean is None:
+                clean = self._clean_profiled(text)
+                self.cache.put(text, clean)
+            return clean
+
+    def _clean_profiled(self, text):
+        """Sama dengan ``_clean`` tetapi alay & stem dipisah agar tiap tahap bisa diukur."""
+        clock, record = time.perf_counter, PROFILER.record
+        t0 = clock()
+        tokens = _TAGS.sub(' ', _SYMBOLS.sub(' ', text.lower())).split()
+        t1 = clock()
+        record('normalize', t1 - t0)
+
+        if self._stem_word is None:
+            prestemmed = ' '.join([self._alay_text(w) for w in tokens])
+            t2 = clock()
+            record('alay', t2 - t1)
+            stemmed = self.stemmer.stem(prestemmed).split()
+        else:
+            words = []
+            for token in tokens:
+                mapped = self._alay_words.get(token)
+                if mapped is None and self.alay_index is not None:
+                    mapped = self._approx_words(token)
+                if mapped is None:
+                    words.append(token)
+                else:
+                    words.extend(mapped)
+            t2 = clock()
+            record('alay', t2 - t1)
+            stemmed = [self._stem_word(w) for w in words]
+        t3 = clock()
+        record('stem', t3 - t2)
+
+        stopwords = self.stopwords
+        clean = ' '.join([w for w in stemmed if w and w not in stopwords])
+        record('stopword', clock() - t3)
+        PROFILER.tokens.inc(len(tokens))
+        return clean
@@ -0,0 +1,91 @@
+# ============================================================
+# 🔬 modules/profiling.py — Instrumentasi per tahap jalur prediksi
+# ============================================================
+"""Timer, counter, dan histogram per tahap preprocess & predict_labels.
+
+Nonaktif secara default (aktifkan dengan ``ETHICATOR_PROFILE=1`` atau
+``PROFILER.enabled = True``). Saat nonaktif, jalur panas hanya membaca satu
+atribut boolean; versi terinstrumentasi dijalankan di cabang terpisah.
+
+Tahap yang dicatat:
+    preprocess, normalize (lowercase + regex), alay, stem, stopword,
+    predict_labels, vectorize, predict_proba
+
+Setiap tahap punya histogram kumulatif (format Prometheus, lewat
+modules/metrics.py) dan jendela bergulir sampel terakhir untuk kuantil cepat
+di panel debug sidebar.
+"""
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+
+from modules.metrics import Counter, Histogram, render_prometheus
+
+STAGES = ("preprocess", "normalize", "alay", "stem", "stopword",
+          "predict_labels", "vectorize", "predict_proba")
+# Bucket (detik) lebih halus dari LATENCY_BUCKETS: satu tahap bisa hanya beberapa µs
+STAGE_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001,
+                 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+
+class StageProfiler:
+    """Kumpulan metrik per tahap; satu instance global ``PROFILER`` per proses."""
+
+    def __init__(self, enabled=False, window=1000):
+        self.enabled = enabled
+        self.window = window
+        self.reset()
+
+    def reset(self):
+        """Kosongkan semua histogram, counter, dan jendela bergulir."""
+        self.histograms = {
+            stage: Histogram("ethicator_stage_seconds", "Durasi satu tahap jalur prediksi.",
+                             buckets=STAGE_BUCKETS, labels={"stage": stage})
+            for stage in STAGES
+        }
+        self.recent = {stage: deque(maxlen=self.window) for stage in STAGES}
+        self.tokens = Counter("ethicator_preprocess_tokens_total", "Token yang diproses preprocess.")
+        self.cache_hits = Counter("ethicator_result_cache_hits_total",
+                                  "Panggilan predict_labels yang dilayani cache hasil.")
+
+    def record(self, stage, seconds):
+        self.histograms[stage].observe(seconds)
+        self.recent[stage].append(seconds)
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def metrics(self):
+        return [*self.histograms.values(), self.tokens, self.cache_hits]
+
+    def prometheus(self):
+        return render_prometheus(self.metrics())
+
+    def summary(self):
+        """Ringkasan per tahap → DataFrame (total panggilan, kuantil jendela bergulir dalam ms)."""
+        import pandas as pd
+
+        rows = []
+        for stage in STAGES:
+            samples = np.array(self.recent[stage]) * 1000
+            if not len(samples):
+                continue
+            rows.append({
+                "Tahap": stage,
+                "Panggilan": self.histograms[stage].count,
+                "Rata-rata (ms)": samples.mean(),
+                "p50 (ms)": np.percentile(samples, 50),
+                "p95 (ms)": np.percentile(samples, 95),
+            })
+        return pd.DataFrame(rows, columns=["Tahap", "Panggilan", "Rata-rata (ms)", "p50 (ms)", "p95 (ms)"]).round(3)
+
+
+PROFILER = StageProfiler(enabled=os.environ.get("ETHICATOR_PROFILE") == "1")
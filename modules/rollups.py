@@ -0,0 +1,197 @@
+# ============================================================
+# 🧮 modules/rollups.py — Rollup dashboard yang diperbarui secara inkremental
+# ============================================================
+"""Tabel agregat untuk Ethics Dashboard, dipelihara oleh ActivityStore.
+
+Tabel (semua dikunci per ``username``):
+    user_stats     total per user: komentar, poin, status, aktivitas pertama/terakhir
+    daily_stats    per (user, tanggal): komentar, poin, jumlah per status
+    emotion_stats  per (user, emosi): jumlah komentar
+    label_stats    per (user, label): jumlah status 🟢/🟡/🔴 dan jumlah probabilitas
+                   (label berstatus SKIPPED_STATUS tidak dihitung)
+    word_counts    per (user, kata): frekuensi kata komentar setelah preprocess
+
+Setiap aktivitas baru memanggil ``apply_activity`` di transaksi yang sama dengan
+INSERT-nya, sehingga dashboard membaca O(hari/emosi/label) baris alih-alih
+memindai seluruh log. ``rebuild`` menghitung ulang semuanya dari histori.
+
+Indeks kata butuh preprocessor (alay map, stopword, stemming) sehingga tidak
+bisa dihitung ulang dengan SQL; lihat ``word_tokens`` dan ``rebuild_words``.
+"""
+from collections import Counter
+
+from modules.log_store import LOG_LABELS, SKIPPED_STATUS
+
+# Naikkan bila skema rollup berubah: database lama akan di-rebuild otomatis
+ROLLUP_VERSION = 3
+# Naikkan bila cara tokenisasi berubah: indeks kata akan dibangun ulang
+WORD_INDEX_VERSION = 1
+
+# Ikon status (sama seperti str.contains pada dashboard lama)
+STATUS_ICONS = {"safe": "🟢", "bias": "🟡", "hate": "🔴"}
+_STATUS = ", ".join(STATUS_ICONS)
+_STATUS_DEFS = "\n".join(f"    {k} INTEGER NOT NULL DEFAULT 0," for k in STATUS_ICONS)
+_STATUS_ADD = ", ".join(f"{k} = {k} + excluded.{k}" for k in STATUS_ICONS)
+
+
+def _status_sums(column):
+    return ", ".join(f"COALESCE(SUM(instr({column}, '{icon}') > 0), 0)" for icon in STATUS_ICONS.values())
+
+
+def status_flags(status):
+    """Status teks → tuple 0/1 sesuai urutan STATUS_ICONS."""
+    status = status or ""
+    return tuple(int(icon in status) for icon in STATUS_ICONS.values())
+
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS user_stats (
+    username TEXT PRIMARY KEY,
+    activities INTEGER NOT NULL DEFAULT 0,
+    points INTEGER NOT NULL DEFAULT 0,
+{_STATUS_DEFS}
+    first_activity TEXT,
+    last_activity TEXT
+);
+CREATE TABLE IF NOT EXISTS daily_stats (
+    username TEXT NOT NULL,
+    tanggal TEXT NOT NULL,
+    activities INTEGER NOT NULL DEFAULT 0,
+    points INTEGER NOT NULL DEFAULT 0,
+{_STATUS_DEFS}
+    PRIMARY KEY (username, tanggal)
+);
+CREATE TABLE IF NOT EXISTS emotion_stats (
+    username TEXT NOT NULL,
+    emosi TEXT NOT NULL,
+    activities INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (username, emosi)
+);
+CREATE TABLE IF NOT EXISTS label_stats (
+    username TEXT NOT NULL,
+    label TEXT NOT NULL,
+    activities INTEGER NOT NULL DEFAULT 0,
+{_STATUS_DEFS}
+    prob_sum REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (username, label)
+);
+CREATE TABLE IF NOT EXISTS word_counts (
+    username TEXT NOT NULL,
+    word TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (username, word)
+);
+CREATE INDEX IF NOT EXISTS idx_word_counts_user_count ON word_counts (username, count DESC);
+"""
+
+_UPSERT_USER = f"""
+INSERT INTO user_stats (username, activities, points, {_STATUS}, first_activity, last_activity)
+VALUES (?, 1, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (username) DO UPDATE SET
+    activities = activities + 1,
+    points = points + excluded.points,
+    {_STATUS_ADD},
+    first_activity = MIN(first_activity, excluded.first_activity),
+    last_activity = MAX(last_activity, excluded.last_activity)
+"""
+_UPSERT_DAILY = f"""
+INSERT INTO daily_stats (username, tanggal, activities, points, {_STATUS})
+VALUES (?, ?, 1, ?, ?, ?, ?)
+ON CONFLICT (username, tanggal) DO UPDATE SET
+    activities = activities + 1,
+    points = points + excluded.points,
+    {_STATUS_ADD}
+"""
+_UPSERT_EMOTION = """
+INSERT INTO emotion_stats (username, emosi, activities) VALUES (?, ?, 1)
+ON CONFLICT (username, emosi) DO UPDATE SET activities = activities + 1
+"""
+_UPSERT_LABEL = f"""
+INSERT INTO label_stats (username, label, activities, {_STATUS}, prob_sum)
+VALUES (?, ?, 1, ?, ?, ?, ?)
+ON CONFLICT (username, label) DO UPDATE SET
+    activities = activities + 1,
+    {_STATUS_ADD},
+    prob_sum = prob_sum + excluded.prob_sum
+"""
+
+_UPSERT_WORD = """
+INSERT INTO word_counts (username, word, count) VALUES (?, ?, ?)
+ON CONFLICT (username, word) DO UPDATE SET count = count + excluded.count
+"""
+
+_REBUILD = [
+    f"""INSERT INTO user_stats (username, activities, points, {_STATUS}, first_activity, last_activity)
+    SELECT username, COUNT(*), COALESCE(SUM(poin), 0), {_status_sums("status")}, MIN(tanggal), MAX(tanggal)
+    FROM activities GROUP BY username""",
+    f"""INSERT INTO daily_stats (username, tanggal, activities, points, {_STATUS})
+    SELECT username, substr(tanggal, 1, 10), COUNT(*), COALESCE(SUM(poin), 0), {_status_sums("status")}
+    FROM activities GROUP BY username, substr(tanggal, 1, 10)""",
+    """INSERT INTO emotion_stats (username, emosi, activities)
+    SELECT username, emosi, COUNT(*) FROM activities WHERE emosi IS NOT NULL GROUP BY username, emosi""",
+    f"""INSERT INTO label_stats (username, label, activities, {_STATUS}, prob_sum)
+    """ + "\n    UNION ALL\n    ".join(
+        f"SELECT username, '{label}', COUNT(*), {_status_sums(f'{label.lower()}_status')}, "
+        f"COALESCE(SUM({label.lower()}_prob), 0) FROM activities "
+        f"WHERE {label.lower()}_status IS NOT NULL AND {label.lower()}_status != '{SKIPPED_STATUS}' "
+        f"GROUP BY username"
+        for label in LOG_LABELS
+    ),
+]
+TABLES = ("user_stats", "daily_stats", "emotion_stats", "label_stats")
+
+
+def apply_activity(conn, username, row):
+    """Tambahkan satu aktivitas (nama kolom tampilan) ke semua rollup. Dipanggil di dalam transaksi."""
+    stamp = row["Tanggal"]
+    points = int(row.get("Poin") or 0)
+    flags = status_flags(row.get("Status Etika"))
+    conn.execute(_UPSERT_USER, (username, points, *flags, stamp, stamp))
+    conn.execute(_UPSERT_DAILY, (username, stamp[:10], points, *flags))
+    if row.get("Emosi") is not None:
+        conn.execute(_UPSERT_EMOTION, (username, row["Emosi"]))
+    conn.executemany(_UPSERT_LABEL, [
+        (username, label, *status_flags(row[f"{label}_Status"]), float(row.get(f"{label}_Prob") or 0.0))
+        for label in LOG_LABELS if row.get(f"{label}_Status") not in (None, SKIPPED_STATUS)
+    ])
+
+
+def rebuild(conn):
+    """Kosongkan lalu hitung ulang semua rollup dari tabel activities. Dipanggil di dalam transaksi."""
+    for table in TABLES:
+        conn.execute(f"DELETE FROM {table}")
+    for statement in _REBUILD:
+        conn.execute(statement)
+    conn.execute(
+        "INSERT OR REPLACE INTO meta (key, value) VALUES ('rollup_version', ?)", (str(ROLLUP_VERSION),)
+    )
+
+
+def word_tokens(clean_text):
+    """Teks hasil preprocess → kata untuk analisis bahasa (minimal 3 huruf, seperti dashboard lama)."""
+    return [w for w in clean_text.split() if len(w) > 2]
+
+
+def apply_words(conn, username, words):
+    """Tambahkan kata satu komentar ke ``word_counts``. Dipanggil di dalam transaksi."""
+    conn.executemany(_UPSERT_WORD, [(username, w, n) for w, n in Counter(words).items()])
+
+
+def rebuild_words(conn, rows, preprocess_batch):
+    """Hitung ulang ``word_counts`` dari pasangan (username, komentar). Dipanggil di dalam transaksi.
+
+    ``preprocess_batch``: list komentar → list teks bersih (lihat utils.get_batch_preprocessor).
+    """
+    conn.execute("DELETE FROM word_counts")
+    rows = list(rows)
+    cleaned = preprocess_batch([comment for _, comment in rows]) if rows else []
+    counts = Counter()
+    for (username, _), clean in zip(rows, cleaned):
+        counts.update((username, w) for w in word_tokens(clean))
+    conn.executemany(
+        "INSERT INTO word_counts (username, word, count) VALUES (?, ?, ?)",
+        ((username, word, n) for (username, word), n in counts.items()),
+    )
+    conn.execute(
+        "INSERT OR REPLACE INTO meta (key, value) VALUES ('word_index_version', ?)", (str(WORD_INDEX_VERSION),)
+    )
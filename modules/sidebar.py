@@ -1,6 +1,91 @@
 import streamlit as st
+import hmac
 import os
 
+# Nama panggilan yang boleh membuka ringkasan semua pengguna (kosong = semua nama).
+# Nama panggilan bukan autentikasi — siapa pun bisa mengetik nama apa saja —
+# jadi tampilan admin tetap dikunci token, lihat is_admin.
+ADMIN_USERS = {u.strip() for u in os.environ.get("ETHICATOR_ADMIN_USERS", "").split(",") if u.strip()}
+# Panel debug instrumentasi jalur prediksi (modules/profiling.py)
+DEBUG_PANEL = os.environ.get("ETHICATOR_DEBUG_PANEL") == "1"
+
+
+def current_user():
+    """Username yang sedang login (kunci partisi data); "" jika belum login."""
+    return st.session_state.get("username", "").strip()
+
+
+def admin_token():
+    """Token admin dari env ``ETHICATOR_ADMIN_TOKEN`` atau ``admin_token`` di st.secrets; "" jika tidak diatur."""
+    token = os.environ.get("ETHICATOR_ADMIN_TOKEN", "")
+    if token:
+        return token
+    try:
+        return str(st.secrets.get("admin_token", ""))
+    except FileNotFoundError:  # tidak ada .streamlit/secrets.toml
+        return ""
+
+
+def can_request_admin():
+    """User login ini boleh diminta token admin (token diatur & nama ada di ADMIN_USERS bila diisi)."""
+    user = current_user()
+    return bool(user and admin_token() and (not ADMIN_USERS or user in ADMIN_USERS))
+
+
+def is_admin():
+    """True hanya jika token admin sudah diverifikasi di sesi ini (tanpa token diatur, tidak ada admin).
+
+    Data per user tetap dipartisi berdasarkan nama panggilan, yang bukan kontrol
+    akses; token ini hanya melindungi ringkasan semua pengguna.
+    """
+    return can_request_admin() and st.session_state.get("admin_verified", False)
+
+
+def show_admin_login():
+    """Expander sidebar untuk memasukkan token admin (dibandingkan dengan hmac.compare_digest)."""
+    if is_admin():
+        st.sidebar.caption("🔑 Mode admin aktif")
+        return
+    with st.sidebar.expander("🔑 Admin"):
+        token = st.text_input("Token admin", type="password", key="admin_token_input")
+        if st.button("Verifikasi", key="admin_verify"):
+            if hmac.compare_digest(token.encode("utf-8"), admin_token().encode("utf-8")):
+                st.session_state.admin_verified = True
+                st.rerun()
+            else:
+                st.warning("Token admin salah.")
+
+
+def show_model_status():
+    """Indikator kesiapan model dari warm-up background (modules/warmup.py)."""
+    from modules import warmup
+
+    state = warmup.status()
+    if state["status"] == "loading":
+        st.sidebar.caption("⏳ Model sedang disiapkan...")
+    elif state["status"] == "ready":
+        st.sidebar.caption(f"✅ Model siap ({state['seconds']:.1f} s)")
+    elif state["status"] == "failed":
+        st.sidebar.caption(f"⚠️ Warm-up model gagal: {state['error']}")
+
+
+def show_debug_panel():
+    """Expander sidebar: nyalakan instrumentasi dan lihat latensi per tahap."""
+    from modules.profiling import PROFILER
+
+    with st.sidebar.expander("🔬 Debug: latensi prediksi"):
+        PROFILER.enabled = st.checkbox("Aktifkan instrumentasi", value=PROFILER.enabled, key="profiler_enabled")
+        summary = PROFILER.summary()
+        if summary.empty:
+            st.caption("Belum ada data. Analisis komentar di Ethics Lab dulu.")
+        else:
+            st.dataframe(summary, hide_index=True, use_container_width=True)
+            st.caption(f"Kuantil dari {PROFILER.window} sampel terakhir per tahap.")
+        st.download_button("Unduh metrik (Prometheus)", PROFILER.prometheus(),
+                           file_name="ethicator_metrics.txt", mime="text/plain")
+        if st.button("Reset metrik", key="profiler_reset"):
+            PROFILER.reset()
+
 def show_sidebar():
     # --- Logo Section ---
     logo_path = os.path.join(os.path.dirname(__file__), "..", "assets", "logo.jpg")
@@ -116,6 +201,13 @@ def show_sidebar():
         )
         if st.sidebar.button("Logout"):
             del st.session_state.username
+            st.session_state.pop("admin_verified", None)
+        elif can_request_admin():
+            show_admin_login()
+
+    show_model_status()
+    if DEBUG_PANEL:
+        show_debug_panel()
 
     # Divider sebelum pilih tab
     st.sidebar.markdown('<div class="sidebar-divider"></div>', unsafe_allow_html=True)
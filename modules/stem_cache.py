@@ -0,0 +1,133 @@
+# ============================================================
+# 🌱 modules/stem_cache.py — Cache kata → kata dasar untuk stemmer Sastrawi
+# ============================================================
+"""Cache stemming per kata yang bisa disimpan ke disk.
+
+Bangun ulang cache dari korpus (data/data.csv + data/new_kamusalay.csv):
+    python -m modules.stem_cache
+"""
+import os
+
+import pandas as pd
+from Sastrawi.Stemmer.Filter import TextNormalizer
+
+from modules.lru_cache import LRUCache
+
+STEM_CACHE_PATH = "data/stem_cache.csv"
+# Kata di luar tabel disk (typo, nama, hashtag) hanya disimpan di LRU berbatas
+RUNTIME_CACHE_SIZE = int(os.environ.get("ETHICATOR_STEM_RUNTIME_CACHE_SIZE", 65536))
+
+
+def _index_dictionary(stemmer):
+    """Ganti list kamus kata dasar Sastrawi dengan set.
+
+    ``ArrayDictionary.contains`` memakai ``word in self.words``; pada list
+    ±30 ribu kata itu scan linear di setiap langkah confix stripping.
+    Isinya tidak berubah, jadi hasil stemming tetap identik.
+    """
+    dictionary = stemmer.get_dictionary()
+    if isinstance(dictionary.words, list):
+        dictionary.words = set(dictionary.words)
+
+
+class StemCache:
+    """Pengganti ``CachedStemmer`` Sastrawi dengan tabel kata → stem persisten.
+
+    Antarmukanya sama (``stem(text)``), sehingga bisa langsung dipakai
+    ``preprocess``. Tabel dari disk tidak berubah selama proses berjalan; kata
+    yang belum ada di tabel di-stem lalu disimpan di LRU ``runtime`` berbatas,
+    agar proses panjang (serve / stream / score) tidak tumbuh tanpa batas.
+    Hanya ``warm`` (membangun cache disk) yang menambah isi ``table``.
+    """
+
+    def __init__(self, stemmer, table=None, runtime_size=RUNTIME_CACHE_SIZE):
+        # CachedStemmer bawaan factory membungkus Stemmer asli
+        self._stemmer = getattr(stemmer, "delegatedStemmer", stemmer)
+        _index_dictionary(self._stemmer)
+        self.table = dict(table) if table else {}
+        self.runtime = LRUCache(runtime_size)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.table)
+
+    def root_words(self):
+        """Kata dasar di kamus Sastrawi (set)."""
+        return self._stemmer.get_dictionary().words
+
+    def stem_word(self, word):
+        stem = self.table.get(word)
+        if stem is None:
+            stem = self.runtime.get(word)
+            if stem is None:
+                self.misses += 1
+                stem = self._stemmer.stem(word)
+                self.runtime.put(word, stem)
+                return stem
+        self.hits += 1
+        return stem
+
+    def stem(self, text):
+        """Stem kalimat — normalisasi dan pemecahan kata sama persis dengan Sastrawi."""
+        words = TextNormalizer.normalize_text(text).split(" ")
+        return " ".join([self.stem_word(w) for w in words])
+
+    def warm(self, words):
+        """Tambahkan semua kata ke tabel persisten (kata yang sudah ada dilewati)."""
+        for word in words:
+            if word and word not in self.table:
+                self.misses += 1
+                self.table[word] = self._stemmer.stem(word)
+
+    def save(self, path=STEM_CACHE_PATH):
+        """Simpan tabel ke CSV dua kolom tanpa header (format sama dengan kamus alay)."""
+        rows = sorted((w, s) for w, s in self.table.items() if w)
+        pd.DataFrame(rows).to_csv(path, header=False, index=False, encoding="utf-8")
+
+    @classmethod
+    def load(cls, stemmer, path=STEM_CACHE_PATH, runtime_size=RUNTIME_CACHE_SIZE):
+        """Buat StemCache dari file CSV; tabel kosong jika file belum ada."""
+        table = {}
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            # keep_default_na=False: kata seperti "nan"/"null" tetap string
+            df = pd.read_csv(path, header=None, dtype=str, keep_default_na=False)
+            table = dict(zip(df[0], df[1]))
+        return cls(stemmer, table, runtime_size)
+
+
+def _words(texts):
+    words = set()
+    for text in texts:
+        words.update(TextNormalizer.normalize_text(text).split(" "))
+    words.discard("")
+    return words
+
+
+def corpus_words(texts, alay_dict_map):
+    """Kata-kata yang akan diterima stemmer dari ``preprocess`` untuk korpus ini."""
+    from utils import prestem
+
+    return _words(prestem(text, alay_dict_map) for text in texts)
+
+
+def main():
+    from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
+
+    alay_dict = pd.read_csv("data/new_kamusalay.csv", encoding="latin-1", header=None)
+    alay_dict_map = dict(zip(alay_dict[0], alay_dict[1]))
+    tweets = pd.read_csv("data/data.csv", encoding="latin-1")["Tweet"]
+
+    words = corpus_words(tweets, alay_dict_map)
+    # Hasil normalisasi alay masuk ke stemmer apa adanya
+    words |= _words(alay_dict[1].astype(str))
+
+    cache = StemCache.load(StemmerFactory().create_stemmer())
+    before = len(cache)
+    cache.warm(sorted(words))
+    cache.save()
+    print(f"{STEM_CACHE_PATH}: {len(cache)} kata ({len(cache) - before} baru)")
+
+
+if __name__ == "__main__":
+    main()
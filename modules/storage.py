@@ -0,0 +1,301 @@
+# ============================================================
+# 🗄️ modules/storage.py — Penyimpanan aktivitas & skor di SQLite (WAL)
+# ============================================================
+"""Log Self Reflection dan skor harian Ethics Academy dalam satu database SQLite.
+
+Tabel:
+    activities  satu baris per komentar yang disimpan (kolom tetap + 12 label)
+    scores      skor kuis per (username, tanggal); menyimpan ulang = menimpa
+    meta        penanda migrasi & versi rollup
+
+Rollup dashboard (user_stats, daily_stats, emotion_stats, label_stats) ada di
+modules/rollups.py dan diperbarui di transaksi yang sama dengan INSERT aktivitas.
+
+Data dipartisi per ``username``: semua query dashboard memakai kunci atau
+indeks (username, ...) sehingga hanya menyentuh baris milik user tersebut, dan
+tampilan admin dibaca dari ``user_stats`` (satu baris per user) tanpa scan log.
+Mode WAL membuat pembaca (dashboard) tidak menunggu penulis (Self Reflection).
+"""
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+import pandas as pd
+
+from modules import rollups
+from modules.log_store import (
+    ETHICS_LOG_COLUMNS, ETHICS_LOG_PATH, LOG_LABELS, SCORE_LOG_PATH, latest_scores, read_csv_log,
+)
+from modules.rollups import STATUS_ICONS
+
+DB_PATH = os.environ.get("ETHICATOR_DB_PATH", "data/ethicator.db")
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Kolom tampilan (nama di CSV lama / UI) → kolom SQLite
+BASE_COLUMNS = {
+    "Tanggal": "tanggal",
+    "Komentar": "komentar",
+    "Emosi": "emosi",
+    "Kesalahan/Tantangan": "kesalahan",
+    "Rencana Perbaikan": "rencana",
+    "Status Etika": "status",
+    "Feedback": "feedback",
+    "Poin": "poin",
+}
+LABEL_COLUMNS = {
+    f"{label}_{field}": f"{label.lower()}_{field.lower()}"
+    for label in LOG_LABELS for field in ("Prob", "Status")
+}
+ACTIVITY_COLUMNS = {**BASE_COLUMNS, **LABEL_COLUMNS}
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS activities (
+    id INTEGER PRIMARY KEY,
+    username TEXT NOT NULL DEFAULT '',
+    tanggal TEXT NOT NULL,
+    komentar TEXT,
+    emosi TEXT,
+    kesalahan TEXT,
+    rencana TEXT,
+    status TEXT,
+    feedback TEXT,
+    poin INTEGER NOT NULL DEFAULT 0,
+    {", ".join(f"{col} {'REAL' if col.endswith('_prob') else 'TEXT'}" for col in LABEL_COLUMNS.values())}
+);
+CREATE INDEX IF NOT EXISTS idx_activities_tanggal ON activities (tanggal);
+CREATE INDEX IF NOT EXISTS idx_activities_user_tanggal ON activities (username, tanggal);
+CREATE INDEX IF NOT EXISTS idx_activities_status ON activities (status);
+
+CREATE TABLE IF NOT EXISTS scores (
+    username TEXT NOT NULL DEFAULT '',
+    tanggal TEXT NOT NULL,
+    total_skor INTEGER NOT NULL,
+    PRIMARY KEY (username, tanggal)
+);
+CREATE INDEX IF NOT EXISTS idx_scores_tanggal ON scores (tanggal);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+def _user_filter(username, column="username"):
+    """Potongan WHERE untuk filter user opsional (None = semua user)."""
+    if username is None:
+        return "1 = 1", ()
+    return f"{column} = ?", (username,)
+
+
+class ActivityStore:
+    """Akses database aktivitas. Satu koneksi per thread (Streamlit memakai banyak thread)."""
+
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self.connect() as conn:
+            conn.executescript(_SCHEMA + rollups.SCHEMA)
+        version = self.connect().execute("SELECT value FROM meta WHERE key = 'rollup_version'").fetchone()
+        if version is None or int(version[0]) != rollups.ROLLUP_VERSION:
+            # Database dari versi rollup lain: hitung ulang sekali dari histori
+            self.rebuild_rollups()
+
+    def connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    # ---------- Tulis ----------
+    def add_activity(self, row, username="", words=None):
+        """Simpan satu aktivitas; ``row`` memakai nama kolom tampilan (lihat ACTIVITY_COLUMNS).
+
+        ``words`` adalah kata komentar setelah preprocess (lihat rollups.word_tokens).
+        Tanpa ``words`` indeks kata ditandai usang dan dibangun ulang saat dibutuhkan.
+        """
+        unknown = set(row) - set(ACTIVITY_COLUMNS)
+        if unknown:
+            raise ValueError(f"Kolom aktivitas tidak dikenal: {sorted(unknown)}")
+        columns = ["username"] + [ACTIVITY_COLUMNS[name] for name in row]
+        values = [username] + [
+            float(v) if name.endswith("_Prob") and v is not None else v
+            for name, v in row.items()
+        ]
+        with self.connect() as conn:
+            conn.execute(
+                f"INSERT INTO activities ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                values,
+            )
+            rollups.apply_activity(conn, username, row)
+            if words is not None:
+                rollups.apply_words(conn, username, words)
+            elif row.get("Komentar"):
+                conn.execute("DELETE FROM meta WHERE key = 'word_index_version'")
+
+    def rebuild_rollups(self):
+        """Hitung ulang semua rollup dashboard dari seluruh tabel activities."""
+        with self.connect() as conn:
+            rollups.rebuild(conn)
+
+    def word_index_stale(self):
+        """True jika indeks kata belum dibangun atau dibuat dengan versi tokenisasi lain."""
+        version = self.connect().execute("SELECT value FROM meta WHERE key = 'word_index_version'").fetchone()
+        return version is None or int(version[0]) != rollups.WORD_INDEX_VERSION
+
+    def rebuild_word_index(self, preprocess_batch):
+        """Bangun ulang ``word_counts`` dari seluruh komentar (``preprocess_batch``: list teks → list teks bersih)."""
+        conn = self.connect()
+        with conn:
+            # Kunci tulis sejak awal agar aktivitas baru tidak hilang di antara SELECT dan rebuild
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute("SELECT username, komentar FROM activities WHERE komentar IS NOT NULL").fetchall()
+            rollups.rebuild_words(conn, rows, preprocess_batch)
+
+    def set_score(self, day, total, username=""):
+        with self.connect() as conn:
+            conn.execute(
+                "INSERT INTO scores (username, tanggal, total_skor) VALUES (?, ?, ?) "
+                "ON CONFLICT (username, tanggal) DO UPDATE SET total_skor = excluded.total_skor",
+                (username, day, int(total)),
+            )
+
+    def delete_score(self, day, username=""):
+        with self.connect() as conn:
+            conn.execute("DELETE FROM scores WHERE username = ? AND tanggal = ?", (username, day))
+
+    # ---------- Baca / agregat ----------
+    def user_summary(self, username=None):
+        """Rollup satu user (atau total semua user bila None) dari ``user_stats``."""
+        where, params = _user_filter(username)
+        row = self.connect().execute(
+            f"SELECT COALESCE(SUM(activities), 0), COALESCE(SUM(points), 0), "
+            f"{', '.join(f'COALESCE(SUM({k}), 0)' for k in STATUS_ICONS)} FROM user_stats WHERE {where}",
+            params,
+        ).fetchone()
+        return {"total": row[0], "points": row[1], **dict(zip(STATUS_ICONS, row[2:]))}
+
+    def user_rollups(self):
+        """Satu baris per user untuk tampilan admin (urut poin terbanyak)."""
+        return pd.read_sql_query(
+            f"SELECT username, activities, points, {', '.join(STATUS_ICONS)}, first_activity, last_activity "
+            f"FROM user_stats ORDER BY points DESC, username",
+            self.connect(),
+        )
+
+    def points_between(self, start, end, username=None):
+        """Total poin untuk tanggal ``start`` s.d. ``end`` (objek date, inklusif)."""
+        where, params = _user_filter(username)
+        (total,) = self.connect().execute(
+            f"SELECT COALESCE(SUM(points), 0) FROM daily_stats WHERE {where} AND tanggal BETWEEN ? AND ?",
+            (*params, start.isoformat(), end.isoformat()),
+        ).fetchone()
+        return int(total)
+
+    def status_counts(self, username=None):
+        """Jumlah komentar per kelompok status: {"safe", "bias", "hate", "total"}."""
+        summary = self.user_summary(username)
+        return {k: summary[k] for k in ("total", *STATUS_ICONS)}
+
+    def emotion_counts(self, username=None):
+        where, params = _user_filter(username)
+        return pd.read_sql_query(
+            f"SELECT emosi AS Emosi, SUM(activities) AS Frekuensi FROM emotion_stats "
+            f"WHERE {where} GROUP BY emosi ORDER BY Frekuensi DESC, emosi",
+            self.connect(), params=params,
+        )
+
+    def label_counts(self, username=None):
+        """Per label: jumlah status 🟢/🟡/🔴 dan rata-rata probabilitas (urut LOG_LABELS)."""
+        where, params = _user_filter(username)
+        df = pd.read_sql_query(
+            f"SELECT label, SUM(activities) AS activities, "
+            f"{', '.join(f'SUM({k}) AS {k}' for k in STATUS_ICONS)}, "
+            f"SUM(prob_sum) / SUM(activities) AS mean_prob FROM label_stats WHERE {where} GROUP BY label",
+            self.connect(), params=params,
+        )
+        order = {label: i for i, label in enumerate(LOG_LABELS)}
+        return df.sort_values("label", key=lambda s: s.map(order)).reset_index(drop=True)
+
+    def recent_activities(self, limit=10, username=None):
+        """``limit`` aktivitas terbaru (urut lama → baru) dengan nama kolom tampilan."""
+        where, params = _user_filter(username)
+        select = ", ".join(f'{col} AS "{name}"' for name, col in BASE_COLUMNS.items())
+        df = pd.read_sql_query(
+            f"SELECT {select} FROM activities WHERE {where} ORDER BY tanggal DESC, id DESC LIMIT ?",
+            self.connect(), params=(*params, limit),
+        )
+        return df.iloc[::-1].reset_index(drop=True)
+
+    def top_words(self, limit=15, username=None):
+        """``limit`` kata paling sering [(kata, frekuensi), ...] dari indeks kata."""
+        where, params = _user_filter(username)
+        rows = self.connect().execute(
+            f"SELECT word, SUM(count) AS n FROM word_counts WHERE {where} "
+            f"GROUP BY word ORDER BY n DESC, word LIMIT ?",
+            (*params, limit),
+        )
+        return [(word, int(n)) for word, n in rows]
+
+    def daily_scores(self, days=7, username=None):
+        """Skor kuis per tanggal (jumlah antar user bila ``username`` None), ``days`` tanggal terakhir."""
+        where, params = _user_filter(username)
+        df = pd.read_sql_query(
+            f"SELECT tanggal AS Tanggal, SUM(total_skor) AS Total_Skor FROM scores WHERE {where} "
+            f"GROUP BY tanggal ORDER BY tanggal DESC LIMIT ?",
+            self.connect(), params=(*params, days),
+        )
+        return df.iloc[::-1].reset_index(drop=True)
+
+    # ---------- Migrasi ----------
+    def migrate_csv(self, ethics_csv=ETHICS_LOG_PATH, scores_csv=SCORE_LOG_PATH, username=""):
+        """Impor CSV lama sekali saja. Mengembalikan (jumlah aktivitas, jumlah skor) yang diimpor."""
+        conn = self.connect()
+        with conn:
+            if conn.execute("SELECT 1 FROM meta WHERE key = 'csv_migrated'").fetchone():
+                return 0, 0
+            n_activities = n_scores = 0
+            if os.path.exists(ethics_csv):
+                df = read_csv_log(ethics_csv, ETHICS_LOG_COLUMNS)
+                df = df[[c for c in df.columns if c in ACTIVITY_COLUMNS]]
+                stamps = pd.to_datetime(df["Tanggal"], errors="coerce")
+                df = df[stamps.notna()].assign(Tanggal=stamps.dropna().dt.strftime(TIMESTAMP_FORMAT))
+                df = df.astype(object).where(df.notna(), None)
+                columns = ["username"] + [ACTIVITY_COLUMNS[c] for c in df.columns]
+                conn.executemany(
+                    f"INSERT INTO activities ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                    ([username, *values] for values in df.itertuples(index=False)),
+                )
+                n_activities = len(df)
+            if os.path.exists(scores_csv):
+                scores = latest_scores(scores_csv)
+                conn.executemany(
+                    "INSERT OR REPLACE INTO scores (username, tanggal, total_skor) VALUES (?, ?, ?)",
+                    ((username, str(day), int(total)) for day, total in zip(scores["Tanggal"], scores["Total_Skor"])),
+                )
+                n_scores = len(scores)
+            rollups.rebuild(conn)
+            conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('csv_migrated', ?)",
+                (datetime.now().strftime(TIMESTAMP_FORMAT),),
+            )
+        return n_activities, n_scores
+
+
+_STORE = None
+_STORE_LOCK = threading.Lock()
+
+
+def get_store(path=DB_PATH):
+    """Store bersama per proses; database dibuat & CSV lama dimigrasi saat pertama dipakai."""
+    global _STORE
+    with _STORE_LOCK:
+        if _STORE is None or _STORE.path != path:
+            store = ActivityStore(path)
+            store.migrate_csv()
+            _STORE = store
+        return _STORE
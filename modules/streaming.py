@@ -0,0 +1,138 @@
+# ============================================================
+# 🌊 modules/streaming.py — Prediksi streaming untuk feed komentar tanpa batas
+# ============================================================
+import json
+import queue
+import threading
+import time
+from itertools import islice
+
+_END = object()
+_STOP_POLL = 0.1  # detik; seberapa cepat thread pembaca sadar konsumen sudah berhenti
+
+
+def micro_batches(items, batch_size=256, max_latency=None):
+    """Kelompokkan iterable menjadi list berukuran paling banyak ``batch_size``.
+
+    Jika ``max_latency`` (detik) diisi, batch juga dikirim begitu item pertamanya
+    sudah menunggu selama itu, walaupun batch belum penuh — berguna untuk feed
+    yang lambat seperti stdin. Input dibaca oleh thread terpisah dengan antrean
+    terbatas, jadi feed tidak pernah dimuat seluruhnya ke memori.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size minimal 1")
+
+    iterator = iter(items)
+    if max_latency is None:
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                return
+            yield batch
+
+    buffer = queue.Queue(maxsize=2 * batch_size)
+    stop = threading.Event()  # diset saat konsumen berhenti (selesai, error, atau generator ditinggal)
+
+    def put(item):
+        """``buffer.put`` yang menyerah setelah ``stop``; False jika konsumen sudah pergi."""
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=_STOP_POLL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def reader():
+        # Thread keluar pada put berikutnya setelah ``stop``; yang sedang menunggu
+        # item baru dari ``items`` (mis. stdin) baru keluar saat item itu datang.
+        try:
+            for item in iterator:
+                if not put(item):
+                    return
+        except BaseException as exc:  # diteruskan ke konsumen
+            put((_END, exc))
+        else:
+            put((_END, None))
+
+    threading.Thread(target=reader, daemon=True).start()
+
+    try:
+        batch, deadline = [], None
+        while True:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            try:
+                item = buffer.get(timeout=timeout)
+            except queue.Empty:
+                yield batch
+                batch, deadline = [], None
+                continue
+
+            if isinstance(item, tuple) and len(item) == 2 and item[0] is _END:
+                if batch:
+                    yield batch
+                if item[1] is not None:
+                    raise item[1]
+                return
+
+            batch.append(item)
+            if deadline is None:
+                deadline = time.monotonic() + max_latency
+            if len(batch) >= batch_size:
+                yield batch
+                batch, deadline = [], None
+    finally:
+        stop.set()
+
+
+def stream_predictions(texts, models, vectorizers, preprocessor, feature_index=None,
+                       batch_size=256, max_latency=None, prescreen=None, cascade_gate=None):
+    """Iterable teks masuk, iterable ``(teks, hasil)`` keluar, urutan tetap sama.
+
+    ``hasil`` berformat sama dengan ``predict_labels`` (Probability dibulatkan,
+    Status memakai ambang 0.58 / 0.42), tetapi dihitung per micro-batch.
+    Dengan ``prescreen`` (pre-screen leksikon) hanya komentar yang ditandai yang diskor;
+    ``cascade_gate`` melewati sub-label HS bila probabilitas HS di bawah gate.
+    """
+    from utils import batch_to_results, predict_labels_batch
+
+    for batch in micro_batches(texts, batch_size, max_latency):
+        probs = predict_labels_batch(batch, models, vectorizers, preprocessor, feature_index, prescreen,
+                                     cascade_gate)
+        yield from zip(batch, batch_to_results(probs))
+
+
+def read_jsonl(lines, field="text"):
+    """Baca feed baris demi baris: objek JSON (ambil ``field``) atau teks polos."""
+    for line in lines:
+        line = line.rstrip("\n")
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            record = None
+        if not isinstance(record, dict):
+            record = {field: line}
+        yield record
+
+
+def stream_jsonl(lines, out, models, vectorizers, preprocessor, feature_index=None,
+                 field="text", batch_size=256, max_latency=0.5, prescreen=None, cascade_gate=None):
+    """Skor feed JSONL/teks dan tulis satu objek JSON per komentar ke ``out``."""
+    records = read_jsonl(lines, field)
+    count = 0
+    for batch in micro_batches(records, batch_size, max_latency):
+        texts = [str(record.get(field) or "") for record in batch]
+        for record, (_, results) in zip(batch, stream_predictions(
+                texts, models, vectorizers, preprocessor, feature_index, batch_size=len(texts),
+                prescreen=prescreen, cascade_gate=cascade_gate)):
+            labels = {
+                label: {"Probability": None if info["Probability"] is None else float(info["Probability"]),
+                        "Status": info["Status"]}
+                for label, info in results.items()
+            }
+            out.write(json.dumps({**record, "labels": labels}, ensure_ascii=False) + "\n")
+            count += 1
+        out.flush()
+    return count
@@ -0,0 +1,38 @@
+# ============================================================
+# ⏱️ modules/timing.py — Pengukur waktu render per bagian halaman
+# ============================================================
+import time
+from contextlib import contextmanager
+
+
+class SectionTimer:
+    """Catat durasi tiap bagian (ms) sesuai urutan eksekusi.
+
+    Contoh::
+
+        timer = SectionTimer()
+        with timer.section("Ringkasan"):
+            ...
+        timer.total_ms, timer.sections
+    """
+
+    def __init__(self):
+        self.sections = []
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def section(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.sections.append((name, (time.perf_counter() - start) * 1000))
+
+    @property
+    def total_ms(self):
+        return (time.perf_counter() - self._start) * 1000
+
+    def as_frame(self):
+        import pandas as pd
+
+        return pd.DataFrame(self.sections, columns=["Bagian", "Waktu (ms)"]).round(1)
@@ -0,0 +1,151 @@
+# ============================================================
+# 🏋️ modules/training.py — Latih ulang 12 model label dari data_balance/
+# ============================================================
+"""Pipeline training offline yang menghasilkan ``models/models.pkl``.
+
+Setiap file ``data_balance/<Nama>.csv`` berisi kolom ``Tweet`` (teks yang sudah
+di-preprocess) dan satu kolom label (mis. ``HS_Strong``); sebagai alternatif,
+subset seimbang bisa diturunkan dari tabel bersih modules/corpus.py. Per label dilatih
+TfidfVectorizer (stopword dari ``data/stopwordbahasa.csv``) + LogisticRegression
+dengan split train/test tetap, dan semua label dilatih paralel dengan joblib.
+
+Catatan: model bawaan di ``models/`` tidak tereproduksi persis oleh pipeline
+ini. Vectorizer bawaan di-fit pada data yang berbeda dari split 80% di sini:
+vocabulary HS bawaan 11.597 term, hasil training ini 10.532, dan 11.792 jika
+di-fit pada seluruh HS.csv. Hasilnya lebih lemah (F1 HS 0.828 vs 0.884,
+HS_Physical 0.833 vs 0.974). Karena itu ``ethicator train`` menulis ke
+``models/retrained/`` secara default; menimpa model bawaan butuh ``--force``.
+"""
+import os
+import pickle
+import time
+import tracemalloc
+import warnings
+from glob import glob
+
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
+from sklearn.model_selection import train_test_split
+
+from modules.log_store import LOG_LABELS
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DATA_DIR = "data_balance"
+STOPWORD_PATH = "data/stopwordbahasa.csv"
+TEXT_COLUMN = "Tweet"
+RETRAIN_DIR = "models/retrained"
+# Model yang dipakai app (load_models); tidak ditimpa training tanpa --force
+SHIPPED_PATHS = ("models/models.pkl", "models/model_evaluation.csv", "models/artifact")
+
+
+def shipped_targets(*paths):
+    """Path di ``paths`` yang menunjuk ke model bawaan (SHIPPED_PATHS)."""
+    shipped = {os.path.abspath(p) for p in SHIPPED_PATHS}
+    return [p for p in paths if p and os.path.abspath(p) in shipped]
+
+
+def discover_datasets(data_dir=DATA_DIR):
+    """Label → path CSV, urut sesuai LOG_LABELS (label lain di belakang, alfabetis)."""
+    datasets = {}
+    for path in glob(os.path.join(data_dir, "*.csv")):
+        columns = pd.read_csv(path, nrows=0).columns
+        labels = [c for c in columns if c != TEXT_COLUMN]
+        if TEXT_COLUMN not in columns or len(labels) != 1:
+            raise ValueError(f"{path} harus berisi kolom {TEXT_COLUMN!r} dan tepat satu kolom label.")
+        datasets[labels[0]] = path
+    order = {label: i for i, label in enumerate(LOG_LABELS)}
+    return dict(sorted(datasets.items(), key=lambda item: (order.get(item[0], len(order)), item[0])))
+
+
+def train_label(label, data, stopwords, test_size=0.2, random_state=42):
+    """Latih satu label → (label, vectorizer, model, metrik, detik, peak MB alokasi Python/numpy).
+
+    ``data`` berupa path CSV atau DataFrame dengan kolom ``Tweet`` dan ``label``.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    df = pd.read_csv(data) if isinstance(data, str) else data
+    df = df.dropna(subset=[TEXT_COLUMN, label])
+    X_train, X_test, y_train, y_test = train_test_split(
+        df[TEXT_COLUMN].astype(str), df[label].astype(int),
+        test_size=test_size, random_state=random_state, stratify=df[label],
+    )
+    # Stopword berisi kata ber-tanda hubung (mis. "kira-kira"); sama dengan model yang dirilis
+    warnings.filterwarnings("ignore", message="Your stop_words may be inconsistent")
+    vectorizer = TfidfVectorizer(stop_words=stopwords)
+    model = LogisticRegression(max_iter=1000)
+    model.fit(vectorizer.fit_transform(X_train), y_train)
+
+    pred = model.predict(vectorizer.transform(X_test))
+    metrics = {
+        "Label": label,
+        "Accuracy": round(accuracy_score(y_test, pred), 3),
+        "Precision": round(precision_score(y_test, pred), 3),
+        "Recall": round(recall_score(y_test, pred), 3),
+        "F1_Score": round(f1_score(y_test, pred), 3),
+    }
+
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return label, vectorizer, model, metrics, seconds, peak / 2**20
+
+
+def peak_rss_mb():
+    """Peak RSS proses ini + proses anak (worker joblib) dalam MB; None jika tidak tersedia."""
+    if resource is None:
+        return None
+    usage = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+             + resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    return usage / 1024  # Linux: KB
+
+
+def train_all(data_dir=DATA_DIR, stopword_path=STOPWORD_PATH, n_jobs=-1,
+              test_size=0.2, random_state=42, log=print, datasets=None):
+    """Latih semua label paralel → (models, vectorizers, DataFrame evaluasi).
+
+    ``datasets`` (label → DataFrame, mis. dari corpus.balanced_subsets) menggantikan
+    CSV di ``data_dir`` bila diberikan.
+    """
+    datasets = datasets if datasets is not None else discover_datasets(data_dir)
+    if not datasets:
+        raise FileNotFoundError(f"Tidak ada CSV training di {data_dir}/")
+    stopwords = pd.read_csv(stopword_path, header=None)[0].tolist()
+
+    start = time.perf_counter()
+    results = Parallel(n_jobs=n_jobs)(
+        delayed(train_label)(label, data, stopwords, test_size, random_state)
+        for label, data in datasets.items()
+    )
+
+    models, vectorizers, evaluation = {}, {}, []
+    for label, vectorizer, model, metrics, seconds, peak_mb in results:
+        models[label] = model
+        vectorizers[label] = vectorizer
+        evaluation.append(metrics)
+        log(f"{label:<14} {seconds:6.2f} s  peak {peak_mb:7.1f} MB  F1 {metrics['F1_Score']:.3f}")
+
+    rss = peak_rss_mb()
+    log(f"Total {time.perf_counter() - start:.1f} s untuk {len(models)} label"
+        + (f", peak RSS {rss:.0f} MB" if rss is not None else ""))
+    return models, vectorizers, pd.DataFrame(evaluation)
+
+
+def save_models(models, vectorizers, evaluation, model_path="models/models.pkl",
+                evaluation_path="models/model_evaluation.csv"):
+    """Tulis pickle (format sama dengan load_models) dan CSV evaluasi."""
+    for path in (model_path, evaluation_path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = model_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump({"models": models, "vectorizers": vectorizers}, f)
+    os.replace(tmp_path, model_path)  # pembaca tidak pernah melihat pickle setengah jadi
+    evaluation.to_csv(evaluation_path, index=False)
@@ -0,0 +1,76 @@
+# ============================================================
+# 🔥 modules/warmup.py — Warm-up model di background saat proses mulai
+# ============================================================
+"""Muat dan jalankan seluruh jalur prediksi sekali di thread latar belakang.
+
+``start()`` dipanggil app.py di setiap rerun, tetapi thread hanya dibuat
+sekali per proses. Thread memanggil ``load_predictor`` (isi cache
+``st.cache_resource``) lalu satu ``predict_labels`` dummy, sehingga request
+pertama pengguna tidak pernah memuat model dari nol. ``status()`` dan
+``is_ready()`` dipakai UI untuk menampilkan kesiapan model.
+
+Nonaktifkan dengan ``ETHICATOR_PRELOAD=0``.
+"""
+import os
+import threading
+import time
+
+PRELOAD = os.environ.get("ETHICATOR_PRELOAD", "1") != "0"
+DUMMY_TEXT = "warm up ethicator"
+
+_lock = threading.Lock()
+_ready = threading.Event()
+_thread = None
+_state = {"status": "idle", "seconds": None, "error": None}
+
+
+def warm_prediction_path():
+    """Muat model + resource dan jalankan satu prediksi dummy."""
+    from utils import API_URL, load_predictor, predict_labels
+
+    if API_URL:
+        return  # model ada di service HTTP, tidak ada yang perlu dimuat lokal
+    models, vectorizers, preprocessor, feature_index = load_predictor()
+    predict_labels(DUMMY_TEXT, models, vectorizers, preprocessor, feature_index)
+
+
+def _run(target):
+    start = time.perf_counter()
+    try:
+        target()
+    except Exception as exc:  # UI tetap jalan; tab akan memuat model sendiri
+        _state.update(status="failed", seconds=time.perf_counter() - start,
+                      error=f"{type(exc).__name__}: {exc}")
+    else:
+        # seconds diisi bersamaan dengan status, sebelum _ready diset, agar
+        # pembaca status "ready"/"failed" selalu melihat durasinya
+        _state.update(status="ready", seconds=time.perf_counter() - start)
+        _ready.set()
+
+
+def start(target=warm_prediction_path):
+    """Mulai warm-up jika belum pernah dimulai di proses ini."""
+    global _thread
+    with _lock:
+        if _thread is not None:
+            return
+        _state.update(status="loading")
+        _thread = threading.Thread(target=_run, args=(target,), name="ethicator-warmup", daemon=True)
+        _thread.start()
+
+
+def is_ready():
+    return _ready.is_set()
+
+
+def status():
+    """Salinan status: ``status`` (idle/loading/ready/failed), ``seconds``, ``error``."""
+    return dict(_state)
+
+
+def wait(timeout=None):
+    """Tunggu warm-up yang sedang berjalan selesai; True jika model siap."""
+    thread = _thread
+    if thread is not None and thread is not threading.current_thread():
+        thread.join(timeout)
+    return is_ready()
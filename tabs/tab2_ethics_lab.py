@@ -1,7 +1,7 @@
 # tabs/tab2_ethics_lab.py
 import streamlit as st
 import pandas as pd
-from utils import load_models, load_resources, predict_labels, success_box
+from utils import get_predictor, success_box
 
 def run():
     """
@@ -37,8 +37,7 @@ def run():
     # ==============================
     # Load Model dan Resource
     # ==============================
-    alay_dict_map, stopword_list, stemmer = load_resources()
-    models, vectorizers = load_models()
+    predict = get_predictor()
 
     # ==============================
     # Gaya CSS Tabel Konsisten
@@ -168,7 +167,7 @@ def run():
 
     # Proses hanya jika tombol ditekan
     if submit_btn and user_input:
-        results = predict_labels(user_input, models, vectorizers, alay_dict_map, stopword_list, stemmer)
+        results = predict(user_input)
         df = pd.DataFrame(results).T.reset_index().rename(columns={'index': 'Label'})
 
         # ==============================
@@ -7,22 +7,16 @@ import random
 import os
 from datetime import datetime
 from utils import success_box, warning_box
-import matplotlib.pyplot as plt
-import plotly.graph_objs as go
-
-SCORE_LOG_PATH = "data/personal_scores.csv"
+from modules.sidebar import current_user
+from modules.storage import get_store
 
 # ============================================================
 # 🔧 Fungsi logging skor harian
 # ============================================================
 def log_score(total_score):
+    """Simpan skor hari ini (menimpa skor hari ini yang sudah ada)."""
     today_str = datetime.now().strftime("%Y-%m-%d")
-    df = pd.DataFrame([[today_str, total_score]], columns=["Tanggal","Total_Skor"])
-    if os.path.exists(SCORE_LOG_PATH):
-        df_existing = pd.read_csv(SCORE_LOG_PATH)
-        df_existing = df_existing[df_existing["Tanggal"] != today_str]
-        df = pd.concat([df_existing, df], ignore_index=True)
-    df.to_csv(SCORE_LOG_PATH, index=False)
+    get_store().set_score(today_str, total_score, username=current_user())
 
 # ============================================================
 # 🚀 Fungsi utama tab
@@ -223,11 +217,8 @@ def run():
         st.session_state.selected_answers={}
         st.session_state.game_score=0
         st.session_state.quiz_score=0
-        if os.path.exists(SCORE_LOG_PATH):
-            df=pd.read_csv(SCORE_LOG_PATH)
-            today=datetime.now().strftime("%Y-%m-%d")
-            df=df[df["Tanggal"]!=today]
-            df.to_csv(SCORE_LOG_PATH,index=False)
+        today=datetime.now().strftime("%Y-%m-%d")
+        get_store().delete_score(today, username=current_user())
         success_box("🔄 Skor & jawaban telah di-reset!")
 
     st.button("Reset Skor", on_click=reset_scores)
@@ -236,8 +227,8 @@ def run():
     st.markdown("---")
     st.subheader("📈 Grafik Progres Skor Harian (7 Hari Terakhir)")
 
-    if os.path.exists(SCORE_LOG_PATH):
-        df_score = pd.read_csv(SCORE_LOG_PATH)
+    df_score = get_store().daily_scores(days=7, username=current_user())
+    if not df_score.empty:
         df_score["Tanggal"] = pd.to_datetime(df_score["Tanggal"])
         df_score["Total_Skor"] = df_score["Total_Skor"].astype(int)
         daily_df = df_score.groupby("Tanggal")["Total_Skor"].sum().reset_index().sort_values("Tanggal").tail(7)
@@ -246,6 +237,8 @@ def run():
             x_labels = daily_df["Tanggal"].dt.date.astype(str).tolist()
             y_values = daily_df["Total_Skor"].tolist()
 
+            import plotly.graph_objs as go  # di-import saat grafik pertama kali dibuat
+
             fig = go.Figure()
             fig.add_trace(go.Scatter(
                 x=x_labels,
@@ -1,10 +1,12 @@
 # tabs/tab4_self_reflection.py
 import streamlit as st
-import os
 import pandas as pd
 from datetime import datetime
-from utils import info_box, success_box, warning_box
-from tabs.tab2_ethics_lab import load_models, load_resources, predict_labels
+from utils import get_batch_preprocessor, get_predictor, info_box, success_box, warning_box
+from modules.log_store import LOG_LABELS
+from modules.rollups import word_tokens
+from modules.sidebar import current_user
+from modules.storage import get_store
 
 def run():
     """
@@ -82,8 +84,7 @@ def run():
     # ==============================
     # ⚙️ Load Model & Resources
     # ==============================
-    alay_dict_map, stopword_list, stemmer = load_resources()
-    models, vectorizers = load_models()
+    predict = get_predictor()
 
     # ==============================
     # ✍️ Input Aktivitas Digital
@@ -143,7 +144,7 @@ def run():
     if st.button("💾 Analisis & Simpan Aktivitas"):
         if user_comment.strip():
             # Analisis komentar
-            results = predict_labels(user_comment, models, vectorizers, alay_dict_map, stopword_list, stemmer)
+            results = predict(user_comment)
             
             # Tentukan status utama & poin
             status, feedback, points = "🟢 Etis / Aman", "Komentar aman", 35
@@ -160,10 +161,8 @@ def run():
                 points = 25
 
             # ==============================
-            # Simpan ke CSV (aman untuk file kosong)
+            # Simpan ke database aktivitas (SQLite)
             # ==============================
-            os.makedirs("data", exist_ok=True)
-            log_path = "data/personal_ethics_log.csv"
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             
             row_dict = {
@@ -176,26 +175,16 @@ def run():
                 "Feedback": feedback,
                 "Poin": points
             }
-            for label, info in results.items():
+            for label in LOG_LABELS:
+                info = results.get(label, {})
                 row_dict[f"{label}_Prob"] = info.get("Probability", None)
                 row_dict[f"{label}_Status"] = info.get("Status", None)
-            
-            new_row = pd.DataFrame([row_dict])
-
-            # Aman baca CSV meskipun kosong
-            if os.path.exists(log_path):
-                try:
-                    df_log = pd.read_csv(log_path)
-                    df_log = pd.concat([df_log, new_row], ignore_index=True)
-                except pd.errors.EmptyDataError:
-                    df_log = new_row
-            else:
-                df_log = new_row
 
-            df_log.to_csv(log_path, index=False, encoding='utf-8')
+            words = word_tokens(get_batch_preprocessor()([user_comment])[0])
+            get_store().add_activity(row_dict, username=current_user(), words=words)
 
             # Update session state untuk Tab 5
-            st.session_state["last_activity"] = new_row.iloc[0].to_dict()
+            st.session_state["last_activity"] = dict(row_dict)
             st.session_state["daily_points"] = points
             st.session_state["refresh_trigger"] = st.session_state.get("refresh_trigger", 0) + 1
             st.session_state["dashboard_refresh"] = st.session_state.get("dashboard_refresh", 0) + 1
@@ -208,7 +197,7 @@ def run():
             # ==============================
             st.subheader("📋 Hasil Analisis Komentar")
             analysis_table = pd.DataFrame([
-                {"Label": label, "Probability": round(info.get("Probability", 0), 2), "Status": info.get("Status", "")} 
+                {"Label": label, "Probability": info.get("Probability"), "Status": info.get("Status", "")} 
                 for label, info in results.items()
             ])
             render_styled_table(analysis_table)
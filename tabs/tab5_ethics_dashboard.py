@@ -3,14 +3,51 @@
 # ============================================================
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-from collections import Counter
-from wordcloud import WordCloud
+import hashlib
+import io
 import os
-from datetime import datetime, timedelta
-from utils import info_box
-import plotly.express as px
-import plotly.graph_objects as go
+from datetime import date, datetime
+from utils import get_batch_preprocessor, info_box
+from modules.dashboard_data import data_version, load_dashboard_data
+from modules.sidebar import current_user, is_admin
+from modules.storage import get_store
+from modules.timing import SectionTimer
+
+
+# ============================================================
+# 📥 Fungsi: Data dashboard di-cache per versi data
+# ============================================================
+SHOW_TIMING = os.environ.get("ETHICATOR_DASHBOARD_TIMING") == "1"
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def cached_dashboard_data(db_path, user, today, version, refresh):
+    """Snapshot dashboard; ``version`` (mtime DB) & ``refresh`` (counter Self Reflection) hanya kunci cache."""
+    return load_dashboard_data(get_store(db_path), user, date.fromisoformat(today),
+                               max_words=WORDCLOUD_MAX_WORDS)
+
+
+# ============================================================
+# ☁️ Fungsi: WordCloud dari indeks kata (di-cache per isi frekuensi)
+# ============================================================
+WORDCLOUD_MAX_WORDS = 200  # sama dengan default max_words WordCloud
+
+
+def frequencies_key(frequencies):
+    """Hash isi frekuensi kata; gambar hanya dibuat ulang jika hash berubah."""
+    payload = "\n".join(f"{w}\t{n}" for w, n in sorted(frequencies.items()))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+@st.cache_data(persist="disk", max_entries=64, show_spinner=False)
+def render_wordcloud(key, _frequencies):
+    """PNG WordCloud 600x400 transparan untuk frekuensi dengan hash ``key``."""
+    from wordcloud import WordCloud
+
+    wc = WordCloud(width=600, height=400, background_color=None, mode="RGBA", colormap="plasma")
+    buffer = io.BytesIO()
+    wc.generate_from_frequencies(_frequencies).to_image().save(buffer, format="PNG")
+    return buffer.getvalue()
 
 
 # ============================================================
@@ -55,6 +92,8 @@ def module_card(title: str, value: str, subtitle: str = "", bg_color: str = "#0E
 # 🚀 Fungsi utama dashboard
 # ============================================================
 def run():
+    import plotly.express as px  # berat; hanya dimuat saat dashboard dibuka
+
     # ============================================================
     # 🏷️ Header
     # ============================================================
@@ -69,169 +108,184 @@ def run():
     st.markdown("---")
 
     # ============================================================
-    # 📥 Load personal ethics log
+    # 📥 Load data dashboard (di-cache per versi data)
     # ============================================================
-    log_path = "data/personal_ethics_log.csv"
-    if not os.path.exists(log_path):
-        st.warning("⚠️ Belum ada data personal ethics log. Tambahkan melalui Tab Self Reflection.")
-        return
-
-    try:
-        df = pd.read_csv(log_path)
-    except Exception as e:
-        st.error(f"Gagal membaca log: {e}")
-        return
+    timer = SectionTimer()
+    with timer.section("Load data"):
+        try:
+            store = get_store()
+            user = current_user()
+            if store.word_index_stale():
+                store.rebuild_word_index(get_batch_preprocessor())
+            data = cached_dashboard_data(
+                store.path, user, datetime.now().date().isoformat(),
+                data_version(store), st.session_state.get("dashboard_refresh", 0),
+            )
+        except Exception as e:
+            st.error(f"Gagal membaca log: {e}")
+            return
 
-    if df.empty:
-        st.info("Belum ada data aktivitas yang tersimpan.")
+    total_comments = data.total_comments
+    if total_comments == 0:
+        st.info("Belum ada data aktivitas yang tersimpan. Tambahkan melalui Tab Self Reflection.")
         return
 
-    df["Tanggal"] = pd.to_datetime(df["Tanggal"], errors="coerce").dt.date
-    df = df.dropna(subset=["Tanggal"])
-
     # ============================================================
-    # 📊 Summary Metrics
+    # 📊 Summary Metrics (dari rollup database)
     # ============================================================
-    today = datetime.now().date()
-    start_7d = today - timedelta(days=6)
-    df_today = df[df["Tanggal"] == today]
-    df_week = df[(df["Tanggal"] >= start_7d) & (df["Tanggal"] <= today)]
-
-    total_comments = len(df)
-    daily_points = int(df_today["Poin"].sum()) if not df_today.empty else 0
-    weekly_points = int(df_week["Poin"].sum()) if not df_week.empty else 0
-
-    pos_comments = len(df[df["Status Etika"].str.contains("🟢", na=False)])
-    bias_comments = len(df[df["Status Etika"].str.contains("🟡", na=False)])
-    hate_comments = len(df[df["Status Etika"].str.contains("🔴", na=False)])
+    with timer.section("Ringkasan"):
+        daily_points = data.daily_points
+        weekly_points = data.weekly_points
 
-    pct_safe = (pos_comments / total_comments * 100) if total_comments else 0
-    pct_bias = (bias_comments / total_comments * 100) if total_comments else 0
-    pct_hate = (hate_comments / total_comments * 100) if total_comments else 0
+        pct_safe = data.status["safe"] / total_comments * 100
+        pct_bias = data.status["bias"] / total_comments * 100
+        pct_hate = data.status["hate"] / total_comments * 100
 
-    c1, c2, c3 = st.columns(3)
-    with c1:
-        module_card("🔥 Poin Hari Ini", f"{daily_points}", "Total poin hari ini", "#10B981")
-        module_card("📅 Poin Minggu Ini", f"{weekly_points}", "Akumulasi 7 hari", "#0EA5E9")
-    with c2:
-        module_card("💬 Total Komentar", f"{total_comments}", "Komentar tercatat", "#6366F1")
-        module_card("💚 Etis / Aman", f"{pct_safe:.1f}%", "Persentase komentar etis", "#22C55E")
-    with c3:
-        module_card("💛 Potensi Bias", f"{pct_bias:.1f}%", "Komentar berpotensi bias", "#F59E0B")
-        module_card("❤️ Hate Speech", f"{pct_hate:.1f}%", "Komentar berisiko tinggi", "#EF4444")
+        c1, c2, c3 = st.columns(3)
+        with c1:
+            module_card("🔥 Poin Hari Ini", f"{daily_points}", "Total poin hari ini", "#10B981")
+            module_card("📅 Poin Minggu Ini", f"{weekly_points}", "Akumulasi 7 hari", "#0EA5E9")
+        with c2:
+            module_card("💬 Total Komentar", f"{total_comments}", "Komentar tercatat", "#6366F1")
+            module_card("💚 Etis / Aman", f"{pct_safe:.1f}%", "Persentase komentar etis", "#22C55E")
+        with c3:
+            module_card("💛 Potensi Bias", f"{pct_bias:.1f}%", "Komentar berpotensi bias", "#F59E0B")
+            module_card("❤️ Hate Speech", f"{pct_hate:.1f}%", "Komentar berisiko tinggi", "#EF4444")
 
-    st.markdown("---")
+        st.markdown("---")
 
     # ============================================================
     # 💡 Insight Otomatis
     # ============================================================
-    # Hitung perubahan poin dibanding kemarin
-    yesterday = today - timedelta(days=1)
-    df_yesterday = df[df["Tanggal"] == yesterday]
-    yesterday_points = int(df_yesterday["Poin"].sum()) if not df_yesterday.empty else 0
-
-    diff_points = daily_points - yesterday_points
-
-    if diff_points > 0:
-        insight_text = f"📈 Skor meningkat {diff_points:.1f} poin dibanding kemarin — pertahankan semangat positif!"
-        color = "#22C55E"  # hijau
-    elif diff_points < 0:
-        insight_text = f"📉 Skor menurun {abs(diff_points):.1f} poin dibanding kemarin — evaluasi penyebabnya dengan tenang."
-        color = "#F59E0B"  # kuning
-    else:
-        insight_text = "⚖️ Skor stabil dibanding kemarin — konsisten tetap baik!"
-        color = "#60A5FA"  # biru
-
-    st.markdown(
-        f"<p style='color:{color}; font-size:16px; font-weight:500;'>{insight_text}</p>",
-        unsafe_allow_html=True
-    )
-    st.markdown("---")
+    with timer.section("Insight"):
+        # Hitung perubahan poin dibanding kemarin
+        diff_points = daily_points - data.yesterday_points
+
+        if diff_points > 0:
+            insight_text = f"📈 Skor meningkat {diff_points:.1f} poin dibanding kemarin — pertahankan semangat positif!"
+            color = "#22C55E"  # hijau
+        elif diff_points < 0:
+            insight_text = f"📉 Skor menurun {abs(diff_points):.1f} poin dibanding kemarin — evaluasi penyebabnya dengan tenang."
+            color = "#F59E0B"  # kuning
+        else:
+            insight_text = "⚖️ Skor stabil dibanding kemarin — konsisten tetap baik!"
+            color = "#60A5FA"  # biru
+
+        st.markdown(
+            f"<p style='color:{color}; font-size:16px; font-weight:500;'>{insight_text}</p>",
+            unsafe_allow_html=True
+        )
+        st.markdown("---")
 
     # ============================================================
     # 📝 10 Aktivitas Terakhir
     # ============================================================
-    st.subheader("📝 10 Aktivitas Terakhir")
+    with timer.section("Aktivitas terakhir"):
+        st.subheader("📝 10 Aktivitas Terakhir")
 
-    df["Tanggal"] = pd.to_datetime(df["Tanggal"], dayfirst=True, errors="coerce").dt.date
-    df = df.dropna(subset=["Tanggal"])
-    df_recent = df.sort_values(by="Tanggal", ascending=True).tail(10)
+        df_recent = data.recent.rename(columns={"Emosi": "Emosi (reflektif)"})
 
-    df_recent = df_recent[[
-        "Tanggal",
-        "Komentar",
-        "Emosi",
-        "Kesalahan/Tantangan",
-        "Rencana Perbaikan",
-        "Status Etika",
-        "Feedback",
-        "Poin"
-    ]].rename(columns={"Emosi": "Emosi (reflektif)"})
-
-    render_styled_table(df_recent)
-    st.markdown("---")
+        render_styled_table(df_recent)
+        st.markdown("---")
 
     # ============================================================
     # 📉 Distribusi Emosi
     # ============================================================
-    st.subheader("📉 Distribusi Emosi")
-    if "Emosi" in df.columns and not df["Emosi"].dropna().empty:
-        emo_counts = df["Emosi"].value_counts().reset_index()
-        emo_counts.columns = ["Emosi", "Frekuensi"]
-        emotion_color_map = {
-            "😡 Marah": "#EF4444",
-            "😕 Bingung": "#F59E0B",
-            "🙂 Senang": "#10B981",
-            "😔 Sedih": "#60A5FA",
-            "😐 Netral": "#6366F1"
-        }
-        colors = [emotion_color_map.get(e, "#94A3B8") for e in emo_counts["Emosi"]]
-        fig = px.bar(emo_counts, x="Emosi", y="Frekuensi", color=emo_counts["Emosi"],
-                     color_discrete_sequence=colors, text="Frekuensi")
-        fig.update_traces(showlegend=False, marker_line_width=0)
-        fig.update_layout(
-            plot_bgcolor="rgba(0,0,0,0)", paper_bgcolor="rgba(0,0,0,0)",
-            xaxis=dict(color="white"),
-            yaxis=dict(color="white", dtick=1, tickmode="linear")
-        )
-        st.plotly_chart(fig, use_container_width=True)
-    else:
-        st.info("Belum ada data emosi untuk divisualisasikan.")
-    st.markdown("---")
+    with timer.section("Distribusi emosi"):
+        st.subheader("📉 Distribusi Emosi")
+        emo_counts = data.emotions
+        if not emo_counts.empty:
+            emotion_color_map = {
+                "😡 Marah": "#EF4444",
+                "😕 Bingung": "#F59E0B",
+                "🙂 Senang": "#10B981",
+                "😔 Sedih": "#60A5FA",
+                "😐 Netral": "#6366F1"
+            }
+            colors = [emotion_color_map.get(e, "#94A3B8") for e in emo_counts["Emosi"]]
+            fig = px.bar(emo_counts, x="Emosi", y="Frekuensi", color=emo_counts["Emosi"],
+                         color_discrete_sequence=colors, text="Frekuensi")
+            fig.update_traces(showlegend=False, marker_line_width=0)
+            fig.update_layout(
+                plot_bgcolor="rgba(0,0,0,0)", paper_bgcolor="rgba(0,0,0,0)",
+                xaxis=dict(color="white"),
+                yaxis=dict(color="white", dtick=1, tickmode="linear")
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("Belum ada data emosi untuk divisualisasikan.")
+        st.markdown("---")
 
     # ============================================================
-    # ☁️ Analisis Bahasa Digital
+    # 🏷️ Status per Label (dari rollup label_stats)
     # ============================================================
-    st.subheader("☁️ Analisis Bahasa Digital")
-    corpus = " ".join(df["Komentar"].dropna().astype(str))
-    words = [w.lower() for w in corpus.split() if len(w) > 2]
-    counter = Counter(words)
-    top_words = counter.most_common(15)
-
-    col_a, col_b = st.columns(2)
-    with col_a:
-        if top_words:
-            top_df = pd.DataFrame(top_words, columns=["word", "count"]).sort_values("count", ascending=True)
-            fig = px.bar(top_df, x="count", y="word", orientation="h")
-            fig.update_xaxes(tickmode="linear", dtick=1)
-            fig.update_traces(marker=dict(color=top_df["count"], colorscale=[[0, "#0EA5E9"], [1, "#6366F1"]]))
-            fig.update_layout(plot_bgcolor="rgba(0,0,0,0)", paper_bgcolor="rgba(0,0,0,0)",
-                              xaxis=dict(color="white"), yaxis=dict(color="white"))
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.info("Belum ada cukup data komentar untuk analisis kata.")
-    with col_b:
-        if corpus.strip():
-            wc = WordCloud(width=600, height=400, background_color=None, mode="RGBA", colormap="plasma").generate(corpus)
-            fig_wc, ax_wc = plt.subplots(figsize=(6, 4))
-            fig_wc.patch.set_alpha(0.0)
-            ax_wc.imshow(wc, interpolation="bilinear")
-            ax_wc.axis("off")
-            st.pyplot(fig_wc)
+    with timer.section("Status per label"):
+        st.subheader("🏷️ Status per Label")
+        label_counts = data.labels
+        if not label_counts.empty:
+            # Label yang tidak dievaluasi (pre-screen / cascade) tidak masuk rollup,
+            # jadi jumlah "Dievaluasi" bisa lebih kecil dari total komentar.
+            label_table = label_counts.assign(mean_prob=label_counts["mean_prob"].round(3)).rename(columns={
+                "label": "Label", "activities": "Dievaluasi",
+                "safe": "🟢 Aman", "bias": "🟡 Bias", "hate": "🔴 Hate",
+                "mean_prob": "Rata-rata Probabilitas",
+            })
+            render_styled_table(label_table)
         else:
-            st.info("Belum ada komentar untuk membuat WordCloud.")
+            st.info("Belum ada label yang dievaluasi model.")
+        st.markdown("---")
 
-    st.markdown("---")
+    # ============================================================
+    # ☁️ Analisis Bahasa Digital
+    # ============================================================
+    with timer.section("Analisis bahasa"):
+        st.subheader("☁️ Analisis Bahasa Digital")
+        cloud_words = data.top_words
+        top_words = cloud_words[:15]
+
+        col_a, col_b = st.columns(2)
+        with col_a:
+            if top_words:
+                top_df = pd.DataFrame(top_words, columns=["word", "count"]).sort_values("count", ascending=True)
+                fig = px.bar(top_df, x="count", y="word", orientation="h")
+                fig.update_xaxes(tickmode="linear", dtick=1)
+                fig.update_traces(marker=dict(color=top_df["count"], colorscale=[[0, "#0EA5E9"], [1, "#6366F1"]]))
+                fig.update_layout(plot_bgcolor="rgba(0,0,0,0)", paper_bgcolor="rgba(0,0,0,0)",
+                                  xaxis=dict(color="white"), yaxis=dict(color="white"))
+                st.plotly_chart(fig, use_container_width=True)
+            else:
+                st.info("Belum ada cukup data komentar untuk analisis kata.")
+        with col_b:
+            if cloud_words:
+                frequencies = dict(cloud_words)
+                st.image(render_wordcloud(frequencies_key(frequencies), frequencies), use_container_width=True)
+            else:
+                st.info("Belum ada komentar untuk membuat WordCloud.")
+
+        st.markdown("---")
+
+    # ============================================================
+    # 👥 Ringkasan Semua Pengguna (admin, dari rollup per user)
+    # ============================================================
+    if is_admin():
+        with timer.section("Ringkasan admin"):
+            st.subheader("👥 Ringkasan Semua Pengguna")
+            overall = store.user_summary()
+            rollups = store.user_rollups().rename(columns={
+                "username": "Pengguna", "activities": "Komentar", "points": "Poin",
+                "safe": "🟢 Aman", "bias": "🟡 Bias", "hate": "🔴 Hate",
+                "first_activity": "Aktivitas Pertama", "last_activity": "Aktivitas Terakhir",
+            })
+            c1, c2, c3 = st.columns(3)
+            with c1:
+                module_card("👥 Pengguna", f"{len(rollups)}", "Pengguna dengan aktivitas", "#6366F1")
+            with c2:
+                module_card("💬 Total Komentar", f"{overall['total']}", "Semua pengguna", "#0EA5E9")
+            with c3:
+                pct_hate_all = overall["hate"] / overall["total"] * 100 if overall["total"] else 0
+                module_card("❤️ Hate Speech", f"{pct_hate_all:.1f}%", "Semua pengguna", "#EF4444")
+            render_styled_table(rollups)
+            st.markdown("---")
 
     # ============================================================
     # 🔙 Navigasi
@@ -240,3 +294,10 @@ def run():
         "⬅️ Kembali ke Self Reflection",
         on_click=lambda: st.session_state.update({'tab_selection': 'Self Reflection'})
     )
+
+    # ============================================================
+    # ⏱️ Waktu render per bagian (ETHICATOR_DASHBOARD_TIMING=1)
+    # ============================================================
+    if SHOW_TIMING:
+        with st.expander(f"⏱️ Waktu render: {timer.total_ms:.0f} ms", expanded=False):
+            render_styled_table(timer.as_frame())
@@ -1,15 +1,63 @@
+import numpy as np
 import pandas as pd
+import os
 import re
 import pickle
-from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
+import time
+from contextlib import nullcontext
+from functools import partial
 import streamlit as st
+from modules import warmup
+from modules.api_client import predict_remote, preprocess_remote_batch
+from modules.log_store import SKIPPED_STATUS
+from modules.lru_cache import LRUCache
+from modules.profiling import PROFILER
+
+# Sastrawi, sklearn (lewat modules.artifact/inference) dan kamus baru di-import
+# di dalam load_resources/load_models, agar tab tanpa model tetap cepat dibuka.
+
+# =====================================================
+# 🗃️ CACHE KOMENTAR BERULANG
+# =====================================================
+# Cache LRU untuk komentar berulang (viral / dianalisis ulang di tab lain).
+# Ukuran bisa diatur lewat environment variable atau configure_caches().
+# PREPROCESS_CACHE dikunci teks mentah saja, jadi hanya milik Preprocessor
+# dari load_resources (satu per proses); utils.preprocess tidak memakainya.
+PREPROCESS_CACHE = LRUCache(os.environ.get('ETHICATOR_PREPROCESS_CACHE_SIZE', 4096))
+RESULT_CACHE = LRUCache(os.environ.get('ETHICATOR_RESULT_CACHE_SIZE', 4096))
+
+# Normalisasi alay perkiraan (huruf berulang, kata gabung) — opsional karena
+# model dilatih tanpa normalisasi ini; token yang persis ada di kamus tetap sama.
+FUZZY_ALAY = os.environ.get('ETHICATOR_FUZZY_ALAY') == '1'
+
+
+def configure_caches(preprocess_size=None, result_size=None):
+    """Atur ukuran cache preprocessing dan hasil prediksi (0 = nonaktif)."""
+    if preprocess_size is not None:
+        PREPROCESS_CACHE.resize(preprocess_size)
+    if result_size is not None:
+        RESULT_CACHE.resize(result_size)
+
+
+def cache_stats():
+    """Statistik hit/miss cache preprocessing dan hasil prediksi."""
+    return {'preprocess': PREPROCESS_CACHE.stats(), 'results': RESULT_CACHE.stats()}
+
 
 # =====================================================
 # 1️⃣ LOAD RESOURCE (kamus alay, stopword, stemmer)
 # =====================================================
 @st.cache_resource
 def load_resources():
-    """Load kamus alay, stopword list, dan stemmer hanya sekali."""
+    """Load kamus alay, stopword list, dan stemmer (dengan cache stem dari disk) hanya sekali.
+
+    Dikembalikan sebagai satu objek Preprocessor yang siap dipakai predict_labels;
+    sumbernya tetap tersedia di atribut alay_dict_map, stopwords, dan stemmer.
+    """
+    from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
+    from modules.preprocessor import Preprocessor
+    from modules.stem_cache import STEM_CACHE_PATH, StemCache
+
     alay_dict = pd.read_csv('data/new_kamusalay.csv', encoding='latin-1', header=None)
     alay_dict_map = dict(zip(alay_dict[0], alay_dict[1]))
 
@@ -17,66 +65,358 @@ def load_resources():
     stopword_list = stopword[0].tolist()
 
     factory = StemmerFactory()
-    stemmer = factory.create_stemmer()
+    stemmer = StemCache.load(factory.create_stemmer(), STEM_CACHE_PATH)
+
+    alay_index = build_alay_index(alay_dict_map, stopword_list, stemmer) if FUZZY_ALAY else None
+    return Preprocessor(alay_dict_map, stopword_list, stemmer, cache=PREPROCESS_CACHE, alay_index=alay_index)
+
+
+def build_alay_index(alay_dict_map, stopword_list, stemmer):
+    """AlayIndex untuk mode ETHICATOR_FUZZY_ALAY; ``stemmer`` adalah StemCache.
+
+    Kata dasar Sastrawi dan vocabulary model dilindungi agar kata baku seperti
+    ``matahari`` atau ``pariwisata`` tidak dipecah menjadi kata gabung.
+    """
+    from modules.alay_index import AlayIndex
+    from modules.artifact import ARTIFACT_DIR, load_vocabulary
 
-    return alay_dict_map, stopword_list, stemmer
+    protected = set(stemmer.root_words()) | set(load_vocabulary(ARTIFACT_DIR))
+    return AlayIndex(alay_dict_map, stopword_list, stem=stemmer.stem_word, protected=protected)
 
 
 # =====================================================
 # 2️⃣ TEXT PREPROCESSING
 # =====================================================
 def preprocess(text, alay_dict_map, stopword_list, stemmer):
-    """Lakukan pembersihan teks sebelum diklasifikasi."""
+    """Lakukan pembersihan teks sebelum diklasifikasi.
+
+    Implementasi acuan tanpa cache (resource bisa berbeda di tiap panggilan);
+    Preprocessor dari load_resources memberi hasil yang sama dengan lebih cepat.
+    """
+    with PROFILER.stage('preprocess') if PROFILER.enabled else nullcontext():
+        return _preprocess(text, alay_dict_map, stopword_list, stemmer)
+
+
+def prestem(text, alay_dict_map):
+    """Tahap sebelum stemming: lowercase, buang simbol & tag, normalisasi alay."""
     text = text.lower()
     text = re.sub('[^0-9a-zA-Z]+', ' ', text)                # hilangkan simbol
     text = re.sub('rt|user|www|https?://\S+', ' ', text)     # hilangkan tag user/url
-    text = ' '.join([alay_dict_map.get(w, w) for w in text.split()])  # ubah alay
+    return ' '.join([alay_dict_map.get(w, w) for w in text.split()])  # ubah alay
+
+
+def _preprocess(text, alay_dict_map, stopword_list, stemmer):
+    if PROFILER.enabled:
+        return _preprocess_profiled(text, alay_dict_map, stopword_list, stemmer)
+    text = prestem(text, alay_dict_map)
     text = stemmer.stem(text)
     text = ' '.join([w for w in text.split() if w not in stopword_list])
     return re.sub(r'\s+', ' ', text).strip()
 
 
+def _preprocess_profiled(text, alay_dict_map, stopword_list, stemmer):
+    """_preprocess dengan timer per tahap (lihat modules/profiling.py)."""
+    with PROFILER.stage('normalize'):
+        text = text.lower()
+        text = re.sub('[^0-9a-zA-Z]+', ' ', text)
+        text = re.sub('rt|user|www|https?://\S+', ' ', text)
+        tokens = text.split()
+    with PROFILER.stage('alay'):
+        text = ' '.join([alay_dict_map.get(w, w) for w in tokens])
+    with PROFILER.stage('stem'):
+        text = stemmer.stem(text)
+    with PROFILER.stage('stopword'):
+        text = ' '.join([w for w in text.split() if w not in stopword_list])
+        text = re.sub(r'\s+', ' ', text).strip()
+    PROFILER.tokens.inc(len(tokens))
+    return text
+
+
 # =====================================================
 # 3️⃣ LOAD MODEL & VECTORIZER
 # =====================================================
 @st.cache_resource
 def load_models():
-    """Load semua model & vectorizer dari file pickle."""
+    """Load semua model & vectorizer, plus indeks fitur gabungannya.
+
+    Memakai artifact npy di models/artifact (memory-mapped, tanpa unpickling)
+    bila dibuat dari models.pkl yang sama; selain itu membaca pickle.
+    """
+    from modules.artifact import ARTIFACT_DIR, artifact_is_current, load_artifact
+    from modules.inference import build_feature_index
+
+    if artifact_is_current(ARTIFACT_DIR, 'models/models.pkl'):
+        return load_artifact(ARTIFACT_DIR)
+
     with open('models/models.pkl', 'rb') as f:
         data = pickle.load(f)
-    return data['models'], data['vectorizers']
+    feature_index = build_feature_index(data['vectorizers'], data['models'])
+    return data['models'], data['vectorizers'], feature_index
+
+
+def load_predictor():
+    """Load model dan resource sekaligus: (models, vectorizers, preprocessor, feature_index)."""
+    models, vectorizers, feature_index = load_models()
+    return models, vectorizers, load_resources(), feature_index
+
+
+@st.cache_resource
+def load_prescreen():
+    """Pre-screen leksikon data/abusive.csv untuk opsi --fast (kamus alay dari load_resources)."""
+    from modules.prescreen import ABUSIVE_PATH, Prescreen
+
+    return Prescreen.from_csv(ABUSIVE_PATH, load_resources().alay_dict_map)
+
+
+# URL service inferensi (python -m ethicator serve); kosong = model dimuat lokal
+API_URL = os.environ.get('ETHICATOR_API_URL')
+
+
+def get_predictor():
+    """Fungsi teks → hasil predict_labels, dipakai tab Ethics Lab & Self Reflection.
+
+    Jika ETHICATOR_API_URL diset, tab menjadi klien service HTTP dan tidak perlu
+    memuat model sendiri.
+    """
+    if API_URL:
+        return partial(predict_remote, base_url=API_URL)
+
+    with nullcontext() if warmup.is_ready() else st.spinner("⏳ Model sedang disiapkan..."):
+        warmup.wait()  # jangan memuat dua kali selagi warm-up latar belakang berjalan
+        models, vectorizers, preprocessor, feature_index = load_predictor()
+
+    def predict(text):
+        return predict_labels(text, models, vectorizers, preprocessor, feature_index,
+                              cascade_gate=CASCADE_GATE)
+
+    return predict
+
+
+def get_batch_preprocessor():
+    """Fungsi list teks → list teks bersih, dipakai indeks kata Self Reflection & Dashboard.
+
+    Jika ETHICATOR_API_URL diset, preprocessing dikerjakan service (POST /preprocess)
+    sehingga Sastrawi dan StemCache tidak dimuat di proses Streamlit.
+    """
+    if API_URL:
+        return partial(preprocess_remote_batch, base_url=API_URL)
+    preprocessor = load_resources()
+
+    def preprocess_batch(texts):
+        return [preprocessor(text) for text in texts]
+
+    return preprocess_batch
 
 
 # =====================================================
 # 4️⃣ PREDIKSI LABEL
 # =====================================================
-def predict_labels(text, models, vectorizers, alay_dict_map, stopword_list, stemmer):
-    """Prediksi multi-label hate speech dengan ambang batas tertentu."""
-    clean = preprocess(text, alay_dict_map, stopword_list, stemmer)
-    results = {}
-
-    for label, model in models.items():
-        vec = vectorizers[label].transform([clean])
-        proba = model.predict_proba(vec)[0, 1]
-
-        # Logika label
-        if proba > 0.58:
-            status = "🔴 Hate Speech"
-        elif 0.42 <= proba <= 0.58:
-            status = "🟡 Potensi Bias"
+# SKIPPED_STATUS (modules/log_store.py): status label yang tidak dievaluasi
+# model (pre-screen leksikon / cascade); probabilitasnya None.
+
+# Cascade: label tingkat atas selalu diskor; label lain (sub-label HS) hanya
+# jika probabilitas HS ≥ gate. ETHICATOR_CASCADE_GATE mengaktifkannya di app.
+CASCADE_LABELS = ('HS', 'Abusive')
+CASCADE_GATE = float(os.environ['ETHICATOR_CASCADE_GATE']) if os.environ.get('ETHICATOR_CASCADE_GATE') else None
+
+
+def label_status(proba):
+    """Ubah probabilitas satu label menjadi status etika."""
+    if proba is None or proba != proba:  # None / NaN = label dilewati
+        return SKIPPED_STATUS
+    if proba > 0.58:
+        return "🔴 Hate Speech"
+    elif 0.42 <= proba <= 0.58:
+        return "🟡 Potensi Bias"
+    return "🟢 Etis / Aman"
+
+
+def label_result(proba):
+    """Probabilitas satu label → {"Probability", "Status"} (Probability None jika dilewati)."""
+    skipped = proba is None or proba != proba
+    return {"Probability": None if skipped else round(proba, 2), "Status": label_status(proba)}
+
+
+def _label_features(clean_texts, vectorizers, feature_index):
+    """Hasilkan (label, matriks fitur) — tokenisasi sekali bila indeks gabungan tersedia."""
+    if feature_index is None:
+        for label, vectorizer in vectorizers.items():
+            yield label, vectorizer.transform(clean_texts)
+    else:
+        counts = feature_index.count(clean_texts)
+        for label in feature_index.labels:
+            yield label, feature_index.label_matrix(counts, label)
+
+
+def _predict_proba_matrix(clean_texts, models, vectorizers, feature_index):
+    """Matriks probabilitas (n_teks × n_label, urut sesuai models).
+
+    Memakai scorer linear gabungan bila tersedia, selain itu loop
+    predict_proba per label.
+    """
+    if PROFILER.enabled:
+        return _predict_proba_matrix_profiled(clean_texts, models, vectorizers, feature_index)
+
+    scorer = getattr(feature_index, 'scorer', None)
+    if scorer is not None and scorer.labels == list(models):
+        return scorer.predict_proba(feature_index.count(clean_texts))
+
+    features = dict(_label_features(clean_texts, vectorizers, feature_index))
+    return np.column_stack([
+        model.predict_proba(features[label])[:, 1] for label, model in models.items()
+    ])
+
+
+def _predict_proba_matrix_profiled(clean_texts, models, vectorizers, feature_index):
+    """_predict_proba_matrix dengan tahap vectorize & predict_proba diukur terpisah."""
+    scorer = getattr(feature_index, 'scorer', None)
+    with PROFILER.stage('vectorize'):
+        if scorer is not None and scorer.labels == list(models):
+            counts = feature_index.count(clean_texts)
         else:
-            status = "🟢 Etis / Aman"
+            scorer, features = None, dict(_label_features(clean_texts, vectorizers, feature_index))
+    with PROFILER.stage('predict_proba'):
+        if scorer is not None:
+            return scorer.predict_proba(counts)
+        return np.column_stack([
+            model.predict_proba(features[label])[:, 1] for label, model in models.items()
+        ])
+
+
+def _cascade_proba_matrix(clean_texts, models, vectorizers, feature_index, gate):
+    """_predict_proba_matrix bertahap: HS & Abusive dulu, sub-label hanya untuk baris HS ≥ ``gate``.
+
+    Sub-label baris yang tidak lolos gate berisi NaN (status SKIPPED_STATUS).
+    Teks tetap ditokenisasi sekali; yang dihemat adalah skor model sub-label.
+    """
+    labels = list(models)
+    if 'HS' not in models:
+        return _predict_proba_matrix(clean_texts, models, vectorizers, feature_index)
+    top = [label for label in CASCADE_LABELS if label in models]
+    rest = [label for label in labels if label not in top]
+    top_idx, rest_idx = [labels.index(l) for l in top], [labels.index(l) for l in rest]
+
+    probs = np.full((len(clean_texts), len(labels)), np.nan)
+    scorer = getattr(feature_index, 'scorer', None)
+    if scorer is not None and scorer.labels == labels:
+        counts = feature_index.count(clean_texts)
+        probs[:, top_idx] = scorer.select(top).predict_proba(counts)
+        gated = np.flatnonzero(probs[:, labels.index('HS')] >= gate)
+        if gated.size and rest:
+            probs[np.ix_(gated, rest_idx)] = scorer.select(rest).predict_proba(counts[gated])
+        return probs
+
+    counts = feature_index.count(clean_texts) if feature_index is not None else None
+
+    def score(label, rows):
+        if counts is None:
+            features = vectorizers[label].transform([clean_texts[i] for i in rows])
+        else:
+            features = feature_index.label_matrix(counts[rows], label)
+        return models[label].predict_proba(features)[:, 1]
+
+    every = np.arange(len(clean_texts))
+    for label, j in zip(top, top_idx):
+        probs[:, j] = score(label, every)
+    gated = np.flatnonzero(probs[:, labels.index('HS')] >= gate)
+    if gated.size:
+        for label, j in zip(rest, rest_idx):
+            probs[gated, j] = score(label, gated)
+    return probs
+
+
+def _score_clean(clean_texts, models, vectorizers, feature_index, cascade_gate):
+    """Matriks probabilitas teks bersih, lewat cascade bila ``cascade_gate`` diset."""
+    if cascade_gate is None:
+        return _predict_proba_matrix(clean_texts, models, vectorizers, feature_index)
+    with PROFILER.stage('predict_proba') if PROFILER.enabled else nullcontext():
+        return _cascade_proba_matrix(clean_texts, models, vectorizers, feature_index, cascade_gate)
+
+
+def predict_labels(text, models, vectorizers, preprocessor, feature_index=None, prescreen=None,
+                   cascade_gate=None):
+    """Prediksi multi-label hate speech dengan ambang batas tertentu.
+
+    ``preprocessor`` adalah callable teks mentah → teks bersih (mis. hasil load_resources).
+    ``prescreen`` (pre-screen leksikon, lihat load_prescreen): komentar yang lolos
+    saringan tidak diskor dan semua labelnya berstatus SKIPPED_STATUS. HS tanpa
+    kata kasar ikut terlewat (lihat modules/prescreen.py).
+    ``cascade_gate``: sub-label HS hanya diskor jika probabilitas HS ≥ gate;
+    jika tidak, statusnya SKIPPED_STATUS (lihat CASCADE_LABELS).
+    """
+    start = time.perf_counter() if PROFILER.enabled else None
+    key = (id(models), id(preprocessor), prescreen is not None and id(prescreen), cascade_gate, text)
+    results = RESULT_CACHE.get(key)
+    if results is None:
+        if prescreen is not None and not prescreen(text):
+            probs = [None] * len(models)
+        else:
+            clean = preprocessor(text)
+            probs = _score_clean([clean], models, vectorizers, feature_index, cascade_gate)[0]
+        results = {label: label_result(proba) for label, proba in zip(models, probs)}
+        RESULT_CACHE.put(key, results)
+    elif start is not None:
+        PROFILER.cache_hits.inc()
+
+    if start is not None:
+        PROFILER.record('predict_labels', time.perf_counter() - start)
+    # Salinan agar pemanggil tidak mengubah isi cache
+    return {label: dict(info) for label, info in results.items()}
+
+
+# =====================================================
+# 5️⃣ PREDIKSI BATCH (banyak komentar sekaligus)
+# =====================================================
+def predict_labels_batch(texts, models, vectorizers, preprocessor, feature_index=None, prescreen=None,
+                         cascade_gate=None):
+    """Prediksi probabilitas semua label untuk banyak komentar dalam satu panggilan.
+
+    Setiap vectorizer dan model hanya dipanggil sekali untuk seluruh batch.
+    Hasilnya DataFrame (baris = komentar, kolom = label) berisi probabilitas
+    mentah yang sama persis dengan nilai di predict_labels sebelum dibulatkan.
+    Dengan ``prescreen`` hanya komentar yang ditandai yang di-preprocess dan
+    diskor; baris lainnya berisi NaN (status SKIPPED_STATUS). Dengan
+    ``cascade_gate`` sub-label HS bernilai NaN untuk baris dengan HS < gate.
+    """
+    index = texts.index if isinstance(texts, pd.Series) else None
+    texts = list(texts)
+    if not texts:
+        return pd.DataFrame(columns=list(models), dtype=float)
+
+    if prescreen is None:
+        clean = [preprocessor(t) for t in texts]
+        probs = _score_clean(clean, models, vectorizers, feature_index, cascade_gate)
+    else:
+        flagged, _ = prescreen.partition(texts)
+        probs = np.full((len(texts), len(models)), np.nan)
+        if flagged:
+            clean = [preprocessor(texts[i]) for i in flagged]
+            probs[flagged] = _score_clean(clean, models, vectorizers, feature_index, cascade_gate)
+    return pd.DataFrame(probs, columns=list(models), index=index)
+
+
+def batch_statuses(probs):
+    """Status etika untuk seluruh DataFrame probabilitas (versi vektor dari label_status)."""
+    values = probs.to_numpy(dtype=float)
+    statuses = np.select(
+        [np.isnan(values), values > 0.58, values >= 0.42],
+        [SKIPPED_STATUS, "🔴 Hate Speech", "🟡 Potensi Bias"],
+        default="🟢 Etis / Aman",
+    )
+    return pd.DataFrame(statuses, columns=probs.columns, index=probs.index)
 
-        results[label] = {
-            "Probability": round(proba, 2),
-            "Status": status
-        }
 
-    return results
+def batch_to_results(probs):
+    """Ubah DataFrame hasil predict_labels_batch ke format dict milik predict_labels."""
+    labels = list(probs.columns)
+    return [
+        {label: label_result(proba) for label, proba in zip(labels, row)}
+        for row in probs.to_numpy()
+    ]
 
 
 # =====================================================
-# 5️⃣ CUSTOM ALERT BOXES (pengganti st.info/dll)
+# 6️⃣ CUSTOM ALERT BOXES (pengganti st.info/dll)
 # =====================================================
 
 def info_box(text):